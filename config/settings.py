@@ -1,73 +1,124 @@
 """
 Configuration settings for the content scraper system.
+
+Environment-derived values (API keys, timeouts, limits, ...) are resolved
+lazily: the first access to any of them loads ``.env`` and builds a cached,
+validated :class:`Settings` instance, so importing this module costs no env
+parsing or filesystem work. ``from config.settings import LOG_LEVEL`` keeps
+working through the module-level ``__getattr__`` below.
 """
-import os
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
-# Load environment variables
-load_dotenv()
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:  # only advertise brotli when responses can be decoded
+    ACCEPT_ENCODING = 'gzip, deflate'
 
 # Base directory
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# API Keys
-TWITTER_API_KEY = os.getenv('TWITTER_API_KEY')
-TWITTER_API_SECRET = os.getenv('TWITTER_API_SECRET')
-TWITTER_ACCESS_TOKEN = os.getenv('TWITTER_ACCESS_TOKEN')
-TWITTER_ACCESS_TOKEN_SECRET = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
-TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')
-
-YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-
-PINECONE_API_KEY = os.getenv('PINECONE_API_KEY')
-PINECONE_ENVIRONMENT = os.getenv('PINECONE_ENVIRONMENT')
-WEAVIATE_URL = os.getenv('WEAVIATE_URL')
-WEAVIATE_API_KEY = os.getenv('WEAVIATE_API_KEY')
-
-# Database
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///data/content_scraper.db')
-
-# Scraping Configuration
-USER_AGENT = os.getenv('USER_AGENT', 'ContentScraperBot/1.0')
-REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
-MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
-RATE_LIMIT_CALLS = int(os.getenv('RATE_LIMIT_CALLS', '10'))
-RATE_LIMIT_PERIOD = int(os.getenv('RATE_LIMIT_PERIOD', '60'))
-
-# Logging
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FILE = os.getenv('LOG_FILE', 'logs/scraper.log')
-
-# Processing
-CHUNK_SIZE = int(os.getenv('CHUNK_SIZE', '1000'))
-CHUNK_OVERLAP = int(os.getenv('CHUNK_OVERLAP', '200'))
-EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'text-embedding-ada-002')
-MAX_WORKERS = int(os.getenv('MAX_WORKERS', '5'))
-
-# Content Filtering
-MIN_AUTHENTICITY_SCORE = int(os.getenv('MIN_AUTHENTICITY_SCORE', '75'))
-MIN_CONTENT_LENGTH = int(os.getenv('MIN_CONTENT_LENGTH', '100'))
-
 # Data directories
 DATA_DIR = BASE_DIR / 'data'
 RAW_DATA_DIR = DATA_DIR / 'raw'
 PROCESSED_DATA_DIR = DATA_DIR / 'processed'
 LOGS_DIR = BASE_DIR / 'logs'
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
-
 # Authors configuration
 AUTHORS_CONFIG_PATH = BASE_DIR / 'config' / 'authors.json'
 
+# Start method for every process pool. By the time work is handed to worker
+# processes the parent always has threads running (loguru's enqueued sink
+# writer, scraper thread pools), and a forked child inherits whatever locks
+# those threads held at that instant, so workers are spawned fresh instead.
+PROCESS_START_METHOD = 'spawn'
+
+
+class Settings(BaseSettings):
+    """
+    Settings read from the environment (and ``.env``).
+
+    Every field is type-checked when the object is built, so a malformed
+    value (e.g. ``REQUEST_TIMEOUT=abc``) fails at startup instead of deep
+    inside a scraper.
+    """
+
+    # Anchored to the project root so the CLI works from any directory
+    model_config = SettingsConfigDict(env_file=BASE_DIR / '.env', extra='ignore', frozen=True)
+
+    # API Keys
+    twitter_api_key: Optional[str] = None
+    twitter_api_secret: Optional[str] = None
+    twitter_access_token: Optional[str] = None
+    twitter_access_token_secret: Optional[str] = None
+    twitter_bearer_token: Optional[str] = None
+
+    youtube_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None
+
+    pinecone_api_key: Optional[str] = None
+    pinecone_environment: Optional[str] = None
+    weaviate_url: Optional[str] = None
+    weaviate_api_key: Optional[str] = None
+
+    # Database
+    database_url: str = 'sqlite:///data/content_scraper.db'
+
+    # Scraping Configuration
+    user_agent: str = 'ContentScraperBot/1.0'
+    request_timeout: int = 30
+    max_retries: int = 3
+    rate_limit_calls: int = 10
+    rate_limit_period: int = 60
+
+    # Logging
+    log_level: str = 'INFO'
+    log_file: str = 'logs/scraper.log'
+
+    # Processing
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+    embedding_model: str = 'text-embedding-ada-002'
+    max_workers: int = 5
+
+    # Content Filtering
+    min_authenticity_score: int = 75
+    min_content_length: int = 100
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load and validate settings from the environment (cached)."""
+    return Settings()
+
+
+def ensure_dirs():
+    """Create data and log directories if they don't exist."""
+    for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, LOGS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
 
+
+@lru_cache(maxsize=1)
 def load_authors_config() -> Dict[str, Any]:
-    """Load authors configuration from JSON file."""
+    """
+    Load authors configuration from JSON file.
+
+    The parsed file is cached for the lifetime of the process; call
+    ``load_authors_config.cache_clear()`` to force a re-read.
+    """
+    if orjson is not None:
+        return orjson.loads(AUTHORS_CONFIG_PATH.read_bytes())
+
     with open(AUTHORS_CONFIG_PATH, 'r') as f:
         return json.load(f)
 
@@ -80,21 +131,24 @@ def get_author_config(author_id: str) -> Dict[str, Any]:
     return authors[author_id]
 
 
-# HTTP Headers
-DEFAULT_HEADERS = {
-    'User-Agent': USER_AGENT,
-    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-    'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate',
-    'Connection': 'keep-alive',
-    'Upgrade-Insecure-Requests': '1'
-}
+# HTTP Headers (read-only; sessions copy them once when they are created)
+def _default_headers(settings: Settings) -> Mapping[str, str]:
+    return MappingProxyType({
+        'User-Agent': settings.user_agent,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    })
+
 
 # Platform-specific settings
 YOUTUBE_SETTINGS = {
     'max_results': 50,
     'order': 'date',
-    'type': 'video'
+    'type': 'video',
+    'max_concurrent_requests': 10  # transcript fetches in flight per channel
 }
 
 TWITTER_SETTINGS = {
@@ -103,15 +157,21 @@ TWITTER_SETTINGS = {
     'expansions': ['author_id', 'referenced_tweets.id']
 }
 
-BLOG_SETTINGS = {
-    'timeout': REQUEST_TIMEOUT,
-    'max_pages': 100,
-    'delay_between_requests': 2
-}
+
+def _blog_settings(settings: Settings) -> Dict[str, Any]:
+    return {
+        'timeout': settings.request_timeout,
+        'max_pages': 100,
+        'delay_between_requests': 2,
+        'max_concurrent_requests': 3  # article fetches in flight per blog/book host
+    }
+
 
 PODCAST_SETTINGS = {
     'download_audio': False,  # Set to True to download audio files
-    'transcribe': False  # Set to True to transcribe audio without transcripts
+    'transcribe': False,  # Set to True to transcribe audio without transcripts
+    'parallel_feeds': 8,  # RSS feeds fetched and parsed at once
+    'parallel_downloads': 6  # audio files downloaded at once per feed
 }
 
 # Content extraction selectors (CSS/XPath)
@@ -132,12 +192,17 @@ BLOG_SELECTORS = {
     }
 }
 
+
 # Embedding configuration
-EMBEDDING_CONFIG = {
-    'model': EMBEDDING_MODEL,
-    'batch_size': 100,
-    'max_tokens': 8191
-}
+def _embedding_config(settings: Settings) -> Dict[str, Any]:
+    return {
+        'model': settings.embedding_model,
+        'batch_size': 100,
+        'max_tokens': 8191,
+        'max_batch_tokens': 300000,  # per-request input limit of the embeddings API
+        'max_concurrent_requests': 8
+    }
+
 
 # Vector store configuration
 VECTOR_STORE_CONFIG = {
@@ -146,3 +211,28 @@ VECTOR_STORE_CONFIG = {
     'metric': 'cosine',
     'namespace': 'default'
 }
+
+# Module constants built from settings on first access
+_DERIVED_SETTINGS = {
+    'DEFAULT_HEADERS': _default_headers,
+    'BLOG_SETTINGS': _blog_settings,
+    'EMBEDDING_CONFIG': _embedding_config,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve environment-derived constants such as ``REQUEST_TIMEOUT`` lazily.
+
+    The resolved value is stored in the module namespace, so each name goes
+    through this hook at most once.
+    """
+    if name in _DERIVED_SETTINGS:
+        value = _DERIVED_SETTINGS[name](get_settings())
+    elif name.isupper() and name.lower() in Settings.model_fields:
+        value = getattr(get_settings(), name.lower())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
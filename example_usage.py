@@ -6,12 +6,22 @@ Demonstrates how to use the scraper programmatically.
 from datetime import datetime, timedelta
 from loguru import logger
 
-from config.settings import get_author_config
+from config.settings import ensure_dirs
 from scrapers.blog_scraper import BlogScraper
 from scrapers.twitter_scraper import TwitterScraper
-from validators.authenticity_validator import AuthenticityValidator
-from storage.database import ContentDatabase
-from processing.text_processor import TextProcessor
+
+# Shared orchestrator; built on first use so its validator, database
+# engine and text processor are constructed once for all examples.
+_ORCH = None
+
+
+def _get_orchestrator():
+    """Return the shared ContentScraperOrchestrator, creating it if needed."""
+    global _ORCH
+    if _ORCH is None:
+        from main import ContentScraperOrchestrator
+        _ORCH = ContentScraperOrchestrator()
+    return _ORCH
 
 
 def example_blog_scrape():
@@ -19,7 +29,7 @@ def example_blog_scrape():
     print("\n=== Example 1: Blog Scraping ===\n")
 
     # Get author configuration
-    author_config = get_author_config('tim_ferriss')
+    author_config = _get_orchestrator().authors_config['tim_ferriss']
 
     # Initialize scraper
     scraper = BlogScraper('tim_ferriss', author_config)
@@ -55,7 +65,7 @@ def example_validation():
     }
 
     # Validate
-    validator = AuthenticityValidator()
+    validator = _get_orchestrator().validator
     validated = validator.validate(sample_content)
 
     print(f"Authenticity score: {validated['authenticity_score']}")
@@ -66,8 +76,8 @@ def example_database():
     """Example: Store and retrieve from database."""
     print("\n=== Example 3: Database Operations ===\n")
 
-    # Initialize database
-    db = ContentDatabase()
+    # Shared database
+    db = _get_orchestrator().db
 
     # Get statistics
     stats = db.get_statistics()
@@ -92,8 +102,8 @@ def example_text_processing():
     The book covers topics like elimination, automation, and liberation.
     """
 
-    # Initialize processor
-    processor = TextProcessor()
+    # Shared processor
+    processor = _get_orchestrator().text_processor
 
     # Extract keywords
     keywords = processor.extract_keywords(text)
@@ -113,7 +123,8 @@ def example_full_pipeline():
     print("\n=== Example 5: Full Pipeline ===\n")
 
     # 1. Scrape content
-    author_config = get_author_config('balaji_srinivasan')
+    orchestrator = _get_orchestrator()
+    author_config = orchestrator.authors_config['balaji_srinivasan']
     scraper = BlogScraper('balaji_srinivasan', author_config)
 
     print("Step 1: Scraping...")
@@ -126,20 +137,18 @@ def example_full_pipeline():
 
     # 2. Validate
     print("\nStep 2: Validating...")
-    validator = AuthenticityValidator()
-    validated = validator.validate_batch(content)
+    validated = orchestrator.validator.validate_batch(content)
     authentic = [c for c in validated if c['authenticity_score'] >= 75]
     print(f"✓ {len(authentic)} items passed validation")
 
     # 3. Process
     print("\nStep 3: Processing...")
-    processor = TextProcessor()
-    processed = [processor.process(c) for c in authentic]
+    processed = orchestrator.text_processor.process_batch(authentic)
     print(f"✓ Processed {len(processed)} items")
 
     # 4. Store
     print("\nStep 4: Storing...")
-    db = ContentDatabase()
+    db = orchestrator.db
     saved = db.save_batch(processed)
     print(f"✓ Saved {saved} items to database")
 
@@ -163,6 +172,11 @@ def main():
     print("Content Scraper - Example Usage")
     print("=" * 60)
 
+    ensure_dirs()
+
+    from main import configure_logging
+    configure_logging()
+
     try:
         # Run examples
         example_blog_scrape()
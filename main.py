@@ -2,11 +2,16 @@
 """
 Main orchestrator and CLI for the content scraper system.
 """
+import os
 import sys
 import json
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 import click
 from loguru import logger
@@ -14,10 +19,13 @@ from tqdm import tqdm
 
 from config.settings import (
     load_authors_config,
-    get_author_config,
+    get_settings,
+    ensure_dirs,
     LOG_LEVEL,
     LOG_FILE,
-    LOGS_DIR
+    LOGS_DIR,
+    MAX_WORKERS,
+    PROCESS_START_METHOD
 )
 from scrapers.blog_scraper import BlogScraper
 from scrapers.twitter_scraper import TwitterScraper
@@ -31,10 +39,28 @@ from processing.text_processor import TextProcessor
 from processing.content_extractor import ContentExtractor
 
 
-# Configure logging
-logger.remove()
-logger.add(sys.stderr, level=LOG_LEVEL)
-logger.add(LOGS_DIR / LOG_FILE, rotation="10 MB", level=LOG_LEVEL)
+# Number of items handed to the text processor per call
+PROCESS_BATCH_SIZE = 64
+
+# Don't render progress bars when stderr isn't a terminal (cron, CI, nohup)
+TQDM_DISABLE = not sys.stderr.isatty()
+
+
+def configure_logging(verbose: bool = False):
+    """
+    Install the stderr and log-file sinks.
+
+    Called from the entry points rather than at import time, so spawned
+    worker processes (which re-import this module) don't each open their
+    own rotating file sink. Sinks are enqueued so formatting and writes
+    happen on a background thread rather than in the scraping workers.
+    """
+    logger.remove()
+    if verbose:
+        logger.add(sys.stderr, level="DEBUG", enqueue=True)
+        return
+    logger.add(sys.stderr, level=LOG_LEVEL, enqueue=True)
+    logger.add(LOGS_DIR / LOG_FILE, rotation="10 MB", level=LOG_LEVEL, enqueue=True)
 
 
 class ContentScraperOrchestrator:
@@ -49,56 +75,74 @@ class ContentScraperOrchestrator:
         self.content_extractor = ContentExtractor()
         self.vector_store = None
 
+        # URLs already in the database, loaded on first scrape; platforms
+        # are scraped on several threads, so loading is done under a lock
+        self._known_urls = None
+        self._known_urls_lock = threading.Lock()
+
     def scrape_author(
         self,
         author_id: str,
-        platforms: Optional[list] = None,
+        platforms: Optional[Sequence[str]] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
-        max_items: int = 100
+        max_items: int = 100,
+        refresh: bool = False
     ) -> list:
         """
         Scrape content for an author.
 
         Args:
             author_id: Author identifier
-            platforms: List of platforms to scrape (None for all)
+            platforms: Platforms to scrape (None for all)
             date_from: Start date
             date_to: End date
             max_items: Max items per platform
+            refresh: Re-fetch pages that are already stored
 
         Returns:
             List of scraped content objects
         """
         logger.info(f"Starting scrape for author: {author_id}")
 
-        try:
-            author_config = get_author_config(author_id)
-        except ValueError as e:
-            logger.error(str(e))
+        author_config = self.authors_config.get(author_id)
+        if author_config is None:
+            logger.error(f"Author '{author_id}' not found in configuration")
             return []
 
         all_content = []
 
         # Determine which platforms to scrape
         if platforms is None:
-            platforms = ['blog', 'twitter', 'youtube', 'podcast', 'book']
+            platforms = ('blog', 'twitter', 'youtube', 'podcast', 'book')
+
+        # Scrape platforms concurrently; scrapers share one pooled session
+        with tqdm(
+            total=len(platforms),
+            desc=f"Scraping {author_id}",
+            disable=TQDM_DISABLE
+        ) as pbar, \
+                ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._scrape_platform,
+                    author_id=author_id,
+                    author_config=author_config,
+                    platform=platform,
+                    date_from=date_from,
+                    date_to=date_to,
+                    max_items=max_items,
+                    refresh=refresh
+                ): platform
+                for platform in platforms
+            }
 
-        # Scrape each platform
-        with tqdm(total=len(platforms), desc=f"Scraping {author_id}") as pbar:
-            for platform in platforms:
-                pbar.set_description(f"Scraping {platform}")
+            for future in as_completed(futures):
+                platform = futures[future]
+                pbar.set_description(f"Scraped {platform}")
 
                 try:
-                    content = self._scrape_platform(
-                        author_id=author_id,
-                        author_config=author_config,
-                        platform=platform,
-                        date_from=date_from,
-                        date_to=date_to,
-                        max_items=max_items
-                    )
-
+                    content = future.result()
                     all_content.extend(content)
                     logger.info(f"Scraped {len(content)} items from {platform}")
 
@@ -110,6 +154,16 @@ class ContentScraperOrchestrator:
         logger.info(f"Total items scraped for {author_id}: {len(all_content)}")
         return all_content
 
+    def known_urls(self) -> set:
+        """URLs already stored, so scrapers can skip fetching them again."""
+        if self._known_urls is None:
+            with self._known_urls_lock:
+                if self._known_urls is None:
+                    known = self.db.known_urls()
+                    logger.info(f"Loaded {len(known)} known URLs")
+                    self._known_urls = known
+        return self._known_urls
+
     def _scrape_platform(
         self,
         author_id: str,
@@ -117,7 +171,8 @@ class ContentScraperOrchestrator:
         platform: str,
         date_from: Optional[datetime],
         date_to: Optional[datetime],
-        max_items: int
+        max_items: int,
+        refresh: bool = False
     ) -> list:
         """Scrape a specific platform."""
         content = []
@@ -125,11 +180,12 @@ class ContentScraperOrchestrator:
         try:
             if platform == 'blog':
                 scraper = BlogScraper(author_id, author_config)
-                content = scraper.scrape(
+                content = asyncio.run(scraper.scrape_async(
                     max_pages=max_items // 10,
                     date_from=date_from,
-                    date_to=date_to
-                )
+                    date_to=date_to,
+                    skip_urls=set() if refresh else self.known_urls()
+                ))
 
             elif platform == 'twitter':
                 scraper = TwitterScraper(author_id, author_config)
@@ -149,15 +205,19 @@ class ContentScraperOrchestrator:
 
             elif platform == 'podcast':
                 scraper = PodcastScraper(author_id, author_config)
-                content = scraper.scrape(
+                content = asyncio.run(scraper.scrape_async(
                     max_episodes=max_items,
                     date_from=date_from,
-                    date_to=date_to
-                )
+                    date_to=date_to,
+                    skip_urls=set() if refresh else self.known_urls()
+                ))
 
             elif platform == 'book':
                 scraper = BookScraper(author_id, author_config)
-                content = scraper.scrape(max_chapters=max_items)
+                content = scraper.scrape(
+                    max_chapters=max_items,
+                    skip_urls=set() if refresh else self.known_urls()
+                )
 
         except Exception as e:
             logger.error(f"Error scraping {platform}: {e}", exc_info=True)
@@ -170,17 +230,45 @@ class ContentScraperOrchestrator:
         validated = self.validator.validate_batch(contents)
         return validated
 
+    def filter_authentic(self, contents: list) -> list:
+        """Keep only content meeting MIN_AUTHENTICITY_SCORE."""
+        return self.validator.filter_by_score(contents)
+
     def process_content(self, contents: list) -> list:
-        """Process and analyze content."""
+        """
+        Process and analyze content.
+
+        Processing is CPU-bound, so batches are spread over a process pool
+        when there is more than one batch of work; a single batch runs
+        in-process without starting any workers.
+        """
         logger.info(f"Processing {len(contents)} items")
 
+        batches = [
+            contents[i:i + PROCESS_BATCH_SIZE]
+            for i in range(0, len(contents), PROCESS_BATCH_SIZE)
+        ]
+
+        if len(batches) <= 1:
+            return [
+                item for batch in batches
+                for item in self.text_processor.process_batch(batch)
+            ]
+
         processed = []
-        for content in tqdm(contents, desc="Processing content"):
-            try:
-                processed_content = self.text_processor.process(content)
-                processed.append(processed_content)
-            except Exception as e:
-                logger.error(f"Failed to process content {content.get('id')}: {e}")
+        with tqdm(
+            total=len(contents),
+            desc="Processing content",
+            miniters=max(1, len(contents) // 100),
+            mininterval=0.5,
+            disable=TQDM_DISABLE
+        ) as pbar, ProcessPoolExecutor(
+            max_workers=min(len(batches), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(PROCESS_START_METHOD)
+        ) as executor:
+            for batch, result in zip(batches, executor.map(self.text_processor.process_batch, batches)):
+                processed.extend(result)
+                pbar.update(len(batch))
 
         return processed
 
@@ -188,15 +276,7 @@ class ContentScraperOrchestrator:
         """Create embeddings for content."""
         logger.info(f"Creating embeddings for {len(contents)} items")
 
-        embedded = []
-        for content in tqdm(contents, desc="Creating embeddings"):
-            try:
-                embedded_content = self.content_extractor.embed_content(content)
-                embedded.append(embedded_content)
-            except Exception as e:
-                logger.error(f"Failed to embed content {content.get('id')}: {e}")
-
-        return embedded
+        return self.content_extractor.embed_batch(contents)
 
     def store_content(self, contents: list, store_vectors: bool = False):
         """Store content in database and optionally vector store."""
@@ -206,6 +286,10 @@ class ContentScraperOrchestrator:
         saved = self.db.save_batch(contents)
         logger.info(f"Saved {saved} items to database")
 
+        with self._known_urls_lock:
+            if self._known_urls is not None:
+                self._known_urls.update(c['url'] for c in contents if c.get('url'))
+
         # Store in vector store
         if store_vectors and self.vector_store:
             logger.info("Storing vectors in vector store")
@@ -215,7 +299,7 @@ class ContentScraperOrchestrator:
                 if content.get('embeddings'):
                     vectors.append({
                         'id': content['id'],
-                        'values': content['embeddings'],
+                        'values': list(content['embeddings']),
                         'metadata': {
                             'author': content['author'],
                             'platform': content['platform'],
@@ -237,9 +321,10 @@ class ContentScraperOrchestrator:
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
 def cli(verbose):
     """Content Scraper for Balaji Srinivasan and Tim Ferriss."""
-    if verbose:
-        logger.remove()
-        logger.add(sys.stderr, level="DEBUG")
+    # Validate the environment up front so bad values fail before any work
+    get_settings()
+    ensure_dirs()
+    configure_logging(verbose)
 
 
 @cli.command()
@@ -252,16 +337,17 @@ def cli(verbose):
 @click.option('--process/--no-process', default=True, help='Process content')
 @click.option('--embed/--no-embed', default=False, help='Create embeddings')
 @click.option('--store/--no-store', default=True, help='Store in database')
-def scrape(author, platform, max_items, date_from, date_to, authentic_only, process, embed, store):
+@click.option('--refresh', is_flag=True, help='Re-fetch pages that are already stored')
+def scrape(author, platform, max_items, date_from, date_to, authentic_only, process, embed, store, refresh):
     """Scrape content from specified platforms."""
     orchestrator = ContentScraperOrchestrator()
 
     # Parse dates
-    date_from_dt = datetime.strptime(date_from, '%Y-%m-%d') if date_from else None
-    date_to_dt = datetime.strptime(date_to, '%Y-%m-%d') if date_to else None
+    date_from_dt = datetime.fromisoformat(date_from) if date_from else None
+    date_to_dt = datetime.fromisoformat(date_to) if date_to else None
 
-    # Convert platform tuple to list
-    platforms = list(platform) if platform else None
+    # Click already collects repeated --platform options into a tuple
+    platforms = platform or None
 
     # Scrape
     contents = orchestrator.scrape_author(
@@ -269,7 +355,8 @@ def scrape(author, platform, max_items, date_from, date_to, authentic_only, proc
         platforms=platforms,
         date_from=date_from_dt,
         date_to=date_to_dt,
-        max_items=max_items
+        max_items=max_items,
+        refresh=refresh
     )
 
     # Validate
@@ -277,9 +364,7 @@ def scrape(author, platform, max_items, date_from, date_to, authentic_only, proc
 
     # Filter by authenticity if requested
     if authentic_only:
-        from config.settings import MIN_AUTHENTICITY_SCORE
-        contents = [c for c in contents if c.get('authenticity_score', 0) >= MIN_AUTHENTICITY_SCORE]
-        logger.info(f"Filtered to {len(contents)} authentic items")
+        contents = orchestrator.filter_authentic(contents)
 
     # Process
     if process:
@@ -375,8 +460,7 @@ def scrape_all_cmd(scrape_all, authentic_only):
 
         # Filter if needed
         if authentic_only:
-            from config.settings import MIN_AUTHENTICITY_SCORE
-            contents = [c for c in contents if c.get('authenticity_score', 0) >= MIN_AUTHENTICITY_SCORE]
+            contents = orchestrator.filter_authentic(contents)
 
         # Process
         contents = orchestrator.process_content(contents)
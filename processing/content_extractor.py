@@ -1,16 +1,118 @@
 """
 Content extraction utilities for creating embeddings and structured data.
 """
+import base64
+import json
 import os
-from typing import List, Dict, Any, Optional
+import re
+import time
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Tuple
 
 from loguru import logger
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 from config.settings import OPENAI_API_KEY, EMBEDDING_CONFIG
+from processing.embedding_cache import EmbeddingCache
+
+# Patterns for extract_structured_data; each captures the phrase of interest
+STRUCTURED_PATTERNS = {
+    'goals': [
+        r'goal[s]?\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
+        r'aim[s]?\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
+        r'objective[s]?\s+(?:is|are|was|were)\s+to\s+([^.!?]+)'
+    ],
+    'strategies': [
+        r'strategy\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
+        r'approach\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
+        r'method\s+(?:is|are|was|were)\s+to\s+([^.!?]+)'
+    ],
+    'principles': [
+        r'principle[s]?\s+(?:is|are|was|were)\s+([^.!?]+)',
+        r'rule[s]?\s+(?:is|are|was|were)\s+([^.!?]+)',
+        r'always\s+([^.!?]+)',
+        r'never\s+([^.!?]+)'
+    ]
+}
+
+# Compiled once; each pattern is scanned on its own so overlapping matches
+# (a "never ..." principle inside a goal sentence) are all reported
+STRUCTURED_RES = {
+    category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    for category, patterns in STRUCTURED_PATTERNS.items()
+}
+
+# Quoted passages of 20-200 characters
+QUOTE_RE = re.compile(r'"([^"]{20,200})"')
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model (None if tiktoken is missing)."""
+    if tiktoken is None:
+        logger.warning("tiktoken not installed, approximating token counts. Install with: pip install tiktoken")
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+def decode_embedding(data) -> array:
+    """
+    Convert an embedding from an API response to a packed float array.
+
+    Embeddings requested with ``encoding_format='base64'`` arrive as a
+    base64 string of little-endian float32 values, which is copied straight
+    into the array without building a list of Python floats first.
+    """
+    if isinstance(data, str):
+        return array('f', base64.b64decode(data))
+    return array('f', data)
+
+
+def truncate_to_tokens(text: str, model: str, max_tokens: int) -> Tuple[str, int]:
+    """
+    Truncate text to at most ``max_tokens`` tokens for a model.
+
+    Args:
+        text: Text to truncate
+        model: Model whose tokenizer to use
+        max_tokens: Token limit
+
+    Returns:
+        Tuple of (possibly truncated text, its token count)
+    """
+    encoding = _get_encoding(model)
+
+    if encoding is None:
+        # Approximate, 1 token ≈ 4 chars
+        if len(text) > max_tokens * 4:
+            text = text[:max_tokens * 4]
+        return text, len(text) // 4
+
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) > max_tokens:
+        return encoding.decode(tokens[:max_tokens]), max_tokens
+    return text, len(tokens)
 
 
 class ContentExtractor:
-    """Extract structured information and embeddings from content."""
+    """
+    Extract structured information and embeddings from content.
+
+    Embedding vectors are returned as packed ``array('f')`` (4 bytes per
+    dimension) rather than lists of Python floats, which are roughly 8x
+    larger; convert with ``.tolist()`` where a client requires a list.
+    """
 
     def __init__(self, embedding_model: str = None):
         """
@@ -21,10 +123,19 @@ class ContentExtractor:
         """
         self.embedding_model = embedding_model or EMBEDDING_CONFIG['model']
         self.openai_client = None
+        self.cache = None
 
         # Initialize OpenAI client if API key is available
         if OPENAI_API_KEY:
             self._init_openai()
+            self._init_cache()
+
+    def _init_cache(self):
+        """Open the persistent embedding cache."""
+        try:
+            self.cache = EmbeddingCache()
+        except Exception as e:
+            logger.warning(f"Embedding cache unavailable, continuing without it: {e}")
 
     def _init_openai(self):
         """Initialize OpenAI client."""
@@ -36,7 +147,7 @@ class ContentExtractor:
         except ImportError:
             logger.warning("OpenAI package not installed. Install with: pip install openai")
 
-    def create_embedding(self, text: str) -> Optional[List[float]]:
+    def create_embedding(self, text: str) -> Optional[array]:
         """
         Create embedding for text.
 
@@ -50,31 +161,47 @@ class ContentExtractor:
             logger.warning("OpenAI client not initialized. Cannot create embeddings.")
             return None
 
+        if self.cache:
+            key = self.cache.make_key(self.embedding_model, text)
+            cached = self.cache.get_many([key])
+            if key in cached:
+                return cached[key]
+
         try:
             # Truncate text if too long
-            max_tokens = EMBEDDING_CONFIG['max_tokens']
-            if len(text) > max_tokens * 4:  # Approximate, 1 token ≈ 4 chars
-                text = text[:max_tokens * 4]
+            text, _ = truncate_to_tokens(
+                text, self.embedding_model, EMBEDDING_CONFIG['max_tokens']
+            )
 
             # Create embedding
             response = self.openai_client.embeddings.create(
                 input=text,
-                model=self.embedding_model
+                model=self.embedding_model,
+                encoding_format='base64'
             )
 
-            embedding = response.data[0].embedding
+            embedding = decode_embedding(response.data[0].embedding)
             logger.debug(f"Created embedding with dimension {len(embedding)}")
 
+            if self.cache:
+                self.cache.set_many([(key, embedding)])
+
             return embedding
 
         except Exception as e:
             logger.error(f"Failed to create embedding: {e}")
             return None
 
-    def create_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+    def create_embeddings_batch(self, texts: List[str]) -> List[Optional[array]]:
         """
         Create embeddings for multiple texts.
 
+        Duplicate texts (overlapping chunks, repeated boilerplate) are
+        embedded once and share a vector. Texts already in the embedding
+        cache are served from it; the rest are split into
+        ``EMBEDDING_CONFIG['batch_size']`` batches which are sent
+        concurrently (up to ``max_concurrent_requests`` at a time).
+
         Args:
             texts: List of texts to embed
 
@@ -85,38 +212,136 @@ class ContentExtractor:
             logger.warning("OpenAI client not initialized. Cannot create embeddings.")
             return [None] * len(texts)
 
-        embeddings = []
-        batch_size = EMBEDDING_CONFIG['batch_size']
+        unique = {}
+        positions = [unique.setdefault(text, len(unique)) for text in texts]
+        if len(unique) < len(texts):
+            logger.debug(f"Embedding {len(unique)} unique of {len(texts)} texts")
+            embeddings = self.create_embeddings_batch(list(unique))
+            return [embeddings[i] for i in positions]
 
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
+        if not self.cache:
+            return self._embed_uncached(texts)
 
-            try:
-                # Truncate texts if too long
-                max_tokens = EMBEDDING_CONFIG['max_tokens']
-                truncated_batch = [
-                    text[:max_tokens * 4] if len(text) > max_tokens * 4 else text
-                    for text in batch
-                ]
+        keys = [self.cache.make_key(self.embedding_model, text) for text in texts]
+        cached = self.cache.get_many(keys)
 
-                # Create embeddings
-                response = self.openai_client.embeddings.create(
-                    input=truncated_batch,
-                    model=self.embedding_model
-                )
+        embeddings = [cached.get(key) for key in keys]
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
 
-                batch_embeddings = [item.embedding for item in response.data]
-                embeddings.extend(batch_embeddings)
+        if misses:
+            fresh = self._embed_uncached([texts[i] for i in misses])
+            for i, embedding in zip(misses, fresh):
+                embeddings[i] = embedding
 
-                logger.debug(f"Created {len(batch_embeddings)} embeddings")
+            self.cache.set_many(
+                (keys[i], embedding) for i, embedding in zip(misses, fresh) if embedding
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to create batch embeddings: {e}")
-                embeddings.extend([None] * len(batch))
+        logger.debug(f"Embedding cache: {len(texts) - len(misses)}/{len(texts)} hits")
+        return embeddings
+
+    def _embed_uncached(self, texts: List[str]) -> List[Optional[array]]:
+        """
+        Request embeddings for texts from the API, batching concurrently.
+
+        Texts are truncated to ``max_tokens`` and sorted by token count
+        before being packed into batches, so short texts (tweets) are
+        grouped together instead of being spread across requests that also
+        carry long articles. Each batch holds at most ``batch_size`` texts
+        and ``max_batch_tokens`` tokens. Results are scattered back to the
+        caller's order.
+        """
+        max_tokens = EMBEDDING_CONFIG['max_tokens']
+        truncated = [
+            truncate_to_tokens(text, self.embedding_model, max_tokens)
+            for text in texts
+        ]
+
+        order = sorted(range(len(truncated)), key=lambda i: truncated[i][1])
+        batches = self._pack_batches([truncated[i] for i in order])
+
+        if len(batches) <= 1:
+            results = [self._request_embeddings(batch) for batch in batches]
+        else:
+            workers = min(len(batches), EMBEDDING_CONFIG['max_concurrent_requests'])
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._request_embeddings, batches, repeat(True)))
+
+        # Results come back in submission (sorted) order; undo the sort
+        embeddings = [None] * len(texts)
+        position = 0
+        for batch_embeddings in results:
+            for embedding in batch_embeddings:
+                embeddings[order[position]] = embedding
+                position += 1
 
         return embeddings
 
+    def _pack_batches(self, items: List[Tuple[str, int]]) -> List[List[str]]:
+        """Greedily pack ``(text, tokens)`` pairs into batches by count and tokens."""
+        batch_size = EMBEDDING_CONFIG['batch_size']
+        max_batch_tokens = EMBEDDING_CONFIG['max_batch_tokens']
+
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        for text, tokens in items:
+            if batch and (len(batch) >= batch_size or batch_tokens + tokens > max_batch_tokens):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(text)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def _request_embeddings(
+        self,
+        batch: List[str],
+        jitter: bool = False
+    ) -> List[Optional[array]]:
+        """
+        Send one embeddings request for a batch of texts.
+
+        Args:
+            batch: Texts to embed in a single API call (already truncated)
+            jitter: Sleep briefly first so concurrent requests don't all
+                hit the API at the same instant
+
+        Returns:
+            Embedding vectors (None for each text if the request failed)
+        """
+        if jitter:
+            time.sleep(random.random() * 0.05)
+
+        try:
+            # Create embeddings
+            response = self.openai_client.embeddings.create(
+                input=batch,
+                model=self.embedding_model,
+                encoding_format='base64'
+            )
+
+            batch_embeddings = [decode_embedding(item.embedding) for item in response.data]
+            logger.debug(f"Created {len(batch_embeddings)} embeddings")
+
+            return batch_embeddings
+
+        except Exception as e:
+            logger.error(f"Failed to create batch embeddings: {e}")
+            return [None] * len(batch)
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Get embedding cache hit/miss statistics."""
+        if not self.cache:
+            return {'hits': 0, 'misses': 0, 'hit_rate': 0.0}
+        return self.cache.stats()
+
     def embed_content(self, content_obj: Dict[str, Any]) -> Dict[str, Any]:
         """
         Add embeddings to content object.
@@ -145,6 +370,38 @@ class ContentExtractor:
 
         return content_obj
 
+    def embed_batch(self, content_objs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add embeddings to multiple content objects.
+
+        Texts are sent to the embeddings API in groups of
+        ``EMBEDDING_CONFIG['batch_size']``, one request per group.
+
+        Args:
+            content_objs: List of content dictionaries
+
+        Returns:
+            List of updated content dictionaries
+        """
+        to_embed = []
+        for content_obj in content_objs:
+            if content_obj.get('content'):
+                to_embed.append(content_obj)
+            else:
+                logger.warning(f"No content to embed for {content_obj.get('id')}")
+
+        embeddings = self.create_embeddings_batch([c['content'] for c in to_embed])
+
+        for content_obj, embedding in zip(to_embed, embeddings):
+            if embedding:
+                content_obj['embeddings'] = embedding
+                content_obj['embedded'] = True
+            else:
+                content_obj['embeddings'] = []
+                content_obj['embedded'] = False
+
+        return content_objs
+
     def embed_chunks(self, chunk_objs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Add embeddings to chunk objects.
@@ -193,10 +450,10 @@ class ContentExtractor:
                         "content": text[:4000]  # Limit length
                     }
                 ],
-                temperature=0.3
+                temperature=0.3,
+                response_format={"type": "json_object"}
             )
 
-            import json
             insights = json.loads(response.choices[0].message.content)
             return insights
 
@@ -204,6 +461,21 @@ class ContentExtractor:
             logger.error(f"Failed to extract insights: {e}")
             return {}
 
+    def extract_insights_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract insights from multiple texts concurrently.
+
+        Requests are sent from a thread pool, up to
+        ``EMBEDDING_CONFIG['max_concurrent_requests']`` at a time.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of insight dictionaries, in the order of ``texts``
+        """
+        return self._map_concurrent(self.extract_insights, texts)
+
     def create_summary(self, text: str, max_length: int = 200) -> str:
         """
         Create a summary of text.
@@ -248,6 +520,28 @@ class ContentExtractor:
             summary = '. '.join(sentences[:3]) + '.'
             return summary[:max_length]
 
+    def create_summaries_batch(self, texts: List[str], max_length: int = 200) -> List[str]:
+        """
+        Create summaries of multiple texts concurrently.
+
+        Args:
+            texts: Texts to summarize
+            max_length: Maximum summary length
+
+        Returns:
+            List of summaries, in the order of ``texts``
+        """
+        return self._map_concurrent(self.create_summary, texts, max_length)
+
+    def _map_concurrent(self, func, texts: List[str], *args) -> List[Any]:
+        """Call ``func(text, *args)`` for each text from a bounded thread pool."""
+        if not self.openai_client or len(texts) <= 1:
+            return [func(text, *args) for text in texts]
+
+        workers = min(len(texts), EMBEDDING_CONFIG['max_concurrent_requests'])
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, texts, *(repeat(arg) for arg in args)))
+
     def extract_structured_data(self, content_obj: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract structured data from content.
@@ -269,49 +563,14 @@ class ContentExtractor:
             'quotes': []
         }
 
-        # Extract based on patterns
-        # Goals
-        goal_patterns = [
-            r'goal[s]?\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
-            r'aim[s]?\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
-            r'objective[s]?\s+(?:is|are|was|were)\s+to\s+([^.!?]+)'
-        ]
-
-        # Strategies
-        strategy_patterns = [
-            r'strategy\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
-            r'approach\s+(?:is|are|was|were)\s+to\s+([^.!?]+)',
-            r'method\s+(?:is|are|was|were)\s+to\s+([^.!?]+)'
-        ]
-
-        # Principles
-        principle_patterns = [
-            r'principle[s]?\s+(?:is|are|was|were)\s+([^.!?]+)',
-            r'rule[s]?\s+(?:is|are|was|were)\s+([^.!?]+)',
-            r'always\s+([^.!?]+)',
-            r'never\s+([^.!?]+)'
-        ]
-
-        import re
-
-        for pattern in goal_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                structured['goals'].append(match.group(1).strip())
-
-        for pattern in strategy_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                structured['strategies'].append(match.group(1).strip())
-
-        for pattern in principle_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                structured['principles'].append(match.group(1).strip())
+        # Extract goals, strategies and principles
+        for category, patterns in STRUCTURED_RES.items():
+            for pattern in patterns:
+                for match in pattern.finditer(text):
+                    structured[category].append(match.group(1).strip())
 
         # Extract quotes (text in quotation marks)
-        quote_pattern = r'"([^"]{20,200})"'
-        quotes = re.findall(quote_pattern, text)
+        quotes = QUOTE_RE.findall(text)
         structured['quotes'] = quotes[:5]  # Limit to 5 quotes
 
         return structured
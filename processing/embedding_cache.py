@@ -0,0 +1,166 @@
+"""
+Persistent on-disk cache for text embeddings.
+"""
+import hashlib
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from config.settings import DATA_DIR
+
+DEFAULT_CACHE_PATH = DATA_DIR / 'embedding_cache.sqlite'
+
+# float32 vectors; a new table so float16 blobs from older caches are
+# never decoded with the wrong width
+TABLE = 'embeddings_f32'
+
+# Vectors kept in the in-process LRU in front of SQLite
+DEFAULT_MEMORY_SIZE = 4096
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache keyed by ``sha256(model + text)``.
+
+    Vectors are stored as little-endian float32 blobs, the precision they
+    arrive in, so a cache hit returns exactly what a fresh API call would;
+    they are handed back as packed ``array('f')``.
+    Recently used vectors are also held in an in-process LRU, so repeated
+    texts within a run (reposts, retweets) skip SQLite as well.
+    """
+
+    def __init__(self, path: Optional[Path] = None, memory_size: int = DEFAULT_MEMORY_SIZE):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file to use (defaults to data/embedding_cache.sqlite)
+            memory_size: Number of vectors kept in the in-process LRU
+        """
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {TABLE} (key BLOB PRIMARY KEY, vector BLOB NOT NULL)'
+        )
+        self.conn.commit()
+
+        self.memory: OrderedDict = OrderedDict()
+        self.memory_size = memory_size
+
+        self.hits = 0
+        self.misses = 0
+
+        logger.debug(f"Opened embedding cache: {self.path}")
+
+    @staticmethod
+    def make_key(model: str, text: str) -> bytes:
+        """Build the cache key for a text embedded with a given model."""
+        return hashlib.sha256((model + text).encode('utf-8')).digest()
+
+    @staticmethod
+    def _encode(vector: array) -> bytes:
+        packed = array('f', vector)
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        return packed.tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> array:
+        vector = array('f')
+        vector.frombytes(blob)
+        if sys.byteorder == 'big':
+            vector.byteswap()
+        return vector
+
+    def _remember(self, key: bytes, vector: array):
+        """Add a vector to the in-process LRU (caller holds the lock)."""
+        self.memory[key] = vector
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, array]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Cache keys from :meth:`make_key`
+
+        Returns:
+            Mapping of key to vector for the keys that were found
+        """
+        found = {}
+
+        with self.lock:
+            # In-process LRU first
+            remaining = []
+            for key in dict.fromkeys(keys):
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    found[key] = self.memory[key]
+                else:
+                    remaining.append(key)
+
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(remaining), 500):
+                chunk = remaining[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self.conn.execute(
+                    f'SELECT key, vector FROM {TABLE} WHERE key IN ({placeholders})',
+                    chunk
+                )
+                for key, blob in rows:
+                    found[key] = self._decode(blob)
+                    self._remember(key, found[key])
+
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+
+        return found
+
+    def set_many(self, items: Iterable[tuple]):
+        """
+        Store several vectors.
+
+        Args:
+            items: ``(key, vector)`` pairs
+        """
+        items = list(items)
+        if not items:
+            return
+
+        rows = [(key, self._encode(vector)) for key, vector in items]
+
+        with self.lock:
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO {TABLE} (key, vector) VALUES (?, ?)',
+                rows
+            )
+            self.conn.commit()
+
+            for key, vector in items:
+                self._remember(key, vector)
+
+    def stats(self) -> Dict[str, float]:
+        """Get hit/miss counts and hit rate since the cache was opened."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self.lock:
+            self.conn.close()
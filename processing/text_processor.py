@@ -2,11 +2,69 @@
 Text processing pipeline for content extraction, chunking, and analysis.
 """
 import re
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
 from config.settings import CHUNK_SIZE, CHUNK_OVERLAP
 
+# Common stop words filtered out of keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
+    'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
+    'who', 'when', 'where', 'why', 'how', 'not', 'no', 'yes'
+})
+
+# clean_text substitutions, one group per kind of replacement
+CLEAN_RE = re.compile(
+    r'(\s[\s\u200b\u200c\u200d\ufeff]*)'  # 1: whitespace runs (incl. newlines and
+                                          #    zero-width characters inside them)
+    r'|([\u200b\u200c\u200d\ufeff])'      # 2: zero-width characters
+    r'|([\u201c\u201d])'                  # 3: curly double quotes
+    r'|([\u2018\u2019])'                  # 4: curly single quotes
+)
+_CLEAN_REPLACEMENTS = {1: ' ', 2: '', 3: '"', 4: "'"}
+
+
+def _clean_replacement(match: re.Match) -> str:
+    return _CLEAN_REPLACEMENTS[match.lastindex]
+
+
+# Runs of word characters longer than 3 (punctuation acts as a separator)
+KEYWORD_WORD_RE = re.compile(r'\w{4,}')
+
+# Topic patterns (matched against lowercased text)
+TOPIC_PATTERNS = {
+    'blockchain': r'\b(blockchain|crypto|bitcoin|ethereum|web3|defi)\b',
+    'productivity': r'\b(productivity|efficiency|time management|habits|goals)\b',
+    'business': r'\b(business|startup|entrepreneur|company|revenue)\b',
+    'technology': r'\b(technology|tech|software|ai|machine learning)\b',
+    'health': r'\b(health|fitness|wellness|nutrition|exercise)\b',
+    'finance': r'\b(finance|investment|money|wealth|portfolio)\b',
+    'learning': r'\b(learning|education|knowledge|study|skill)\b',
+    'network': r'\b(network|community|social|connection)\b',
+}
+
+# All topics fused into one scan. Each alternative is a zero-width
+# lookahead, so overlapping matches (e.g. "learning" inside "machine
+# learning") are still reported for every topic, as with separate searches.
+TOPIC_RE = re.compile('|'.join(
+    f'(?=(?P<{topic}>{pattern}))' for topic, pattern in TOPIC_PATTERNS.items()
+))
+
+# Patterns for mention/URL extraction and sentence splitting
+MENTION_RE = re.compile(r'@(\w+)')
+URL_RE = re.compile(
+    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+)
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Runs of vowels, each counted as one syllable
+VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
 
 class TextProcessor:
     """Process and analyze text content."""
@@ -39,8 +97,9 @@ class TextProcessor:
         # Extract key information
         metadata = content_obj.get('metadata', {})
 
-        # Update word count
-        word_count = self.count_words(cleaned_text)
+        # Update word count; clean_text leaves single spaces between words,
+        # so counting separators avoids building a list of every word
+        word_count = cleaned_text.count(' ') + 1 if cleaned_text else 0
         metadata['word_count'] = word_count
         content_obj['word_count'] = word_count
 
@@ -57,6 +116,29 @@ class TextProcessor:
 
         return content_obj
 
+    def process_batch(self, content_objs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a batch of content objects.
+
+        Items that fail to process are logged and left out of the result.
+
+        Args:
+            content_objs: List of content dictionaries
+
+        Returns:
+            List of processed content dictionaries
+        """
+        process = self.process
+        processed = []
+
+        for content_obj in content_objs:
+            try:
+                processed.append(process(content_obj))
+            except Exception as e:
+                logger.error(f"Failed to process content {content_obj.get('id')}: {e}")
+
+        return processed
+
     def clean_text(self, text: str) -> str:
         """
         Clean and normalize text.
@@ -67,11 +149,9 @@ class TextProcessor:
         Returns:
             Cleaned text
         """
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Remove multiple newlines
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        # Collapse whitespace, drop zero-width characters and normalize
+        # curly quotes in a single pass
+        text = CLEAN_RE.sub(_clean_replacement, text)
 
         # Remove URLs (optional - might want to keep for context)
         # text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
@@ -79,13 +159,6 @@ class TextProcessor:
         # Remove special characters but keep punctuation
         # text = re.sub(r'[^\w\s\.\,\!\?\-\;\:\'\"]', '', text)
 
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
-
-        # Remove zero-width characters
-        text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)
-
         return text.strip()
 
     def count_words(self, text: str) -> int:
@@ -103,36 +176,12 @@ class TextProcessor:
         Returns:
             List of keywords
         """
-        # Convert to lowercase
-        text_lower = text.lower()
-
-        # Remove punctuation
-        text_clean = re.sub(r'[^\w\s]', ' ', text_lower)
-
-        # Split into words
-        words = text_clean.split()
+        # Lowercase and split into words longer than 3 characters in one pass
+        words = KEYWORD_WORD_RE.findall(text.lower())
 
-        # Common stop words to filter out
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these',
-            'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'what', 'which',
-            'who', 'when', 'where', 'why', 'how', 'not', 'no', 'yes'
-        }
-
-        # Filter and count
-        word_freq = {}
-        for word in words:
-            if word and len(word) > 3 and word not in stop_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-
-        # Sort by frequency
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-
-        # Return top keywords
-        return [word for word, freq in sorted_words[:max_keywords]]
+        # Count, skipping stop words, and return the most frequent
+        word_freq = Counter(word for word in words if word not in STOP_WORDS)
+        return [word for word, freq in word_freq.most_common(max_keywords)]
 
     def chunk_text(self, text: str, chunk_size: int = None, overlap: int = None) -> List[str]:
         """
@@ -154,24 +203,25 @@ class TextProcessor:
 
         chunks = []
         start = 0
+        text_length = len(text)
 
-        while start < len(text):
-            # Get chunk
+        # Work on indices only; the text is sliced once per emitted chunk
+        while start < text_length:
             end = start + chunk_size
-            chunk = text[start:end]
 
             # Try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence ending
-                last_period = chunk.rfind('.')
-                last_newline = chunk.rfind('\n')
-                break_point = max(last_period, last_newline)
+            if end < text_length:
+                # Look for sentence ending, only in the latter half of the chunk
+                search_from = start + chunk_size // 2 + 1
+                break_point = max(
+                    text.rfind('.', search_from, end),
+                    text.rfind('\n', search_from, end)
+                )
 
-                if break_point > chunk_size // 2:  # Only break if in latter half
-                    chunk = chunk[:break_point + 1]
-                    end = start + break_point + 1
+                if break_point != -1:
+                    end = break_point + 1
 
-            chunks.append(chunk.strip())
+            chunks.append(text[start:end].strip())
 
             # Move to next chunk with overlap
             start = end - overlap
@@ -220,27 +270,14 @@ class TextProcessor:
         Returns:
             List of topics
         """
-        topics = []
-
-        # Define topic patterns
-        topic_patterns = {
-            'blockchain': r'\b(blockchain|crypto|bitcoin|ethereum|web3|defi)\b',
-            'productivity': r'\b(productivity|efficiency|time management|habits|goals)\b',
-            'business': r'\b(business|startup|entrepreneur|company|revenue)\b',
-            'technology': r'\b(technology|tech|software|ai|machine learning)\b',
-            'health': r'\b(health|fitness|wellness|nutrition|exercise)\b',
-            'finance': r'\b(finance|investment|money|wealth|portfolio)\b',
-            'learning': r'\b(learning|education|knowledge|study|skill)\b',
-            'network': r'\b(network|community|social|connection)\b',
-        }
-
-        text_lower = text.lower()
+        found = set()
 
-        for topic, pattern in topic_patterns.items():
-            if re.search(pattern, text_lower):
-                topics.append(topic)
+        for match in TOPIC_RE.finditer(text.lower()):
+            found.add(match.lastgroup)
+            if len(found) == len(TOPIC_PATTERNS):
+                break
 
-        return topics
+        return [topic for topic in TOPIC_PATTERNS if topic in found]
 
     def extract_mentions(self, text: str) -> List[str]:
         """
@@ -252,8 +289,7 @@ class TextProcessor:
         Returns:
             List of mentions
         """
-        mention_pattern = r'@(\w+)'
-        mentions = re.findall(mention_pattern, text)
+        mentions = MENTION_RE.findall(text)
         return list(set(mentions))  # Remove duplicates
 
     def extract_urls(self, text: str) -> List[str]:
@@ -266,9 +302,7 @@ class TextProcessor:
         Returns:
             List of URLs
         """
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        urls = re.findall(url_pattern, text)
-        return urls
+        return URL_RE.findall(text)
 
     def calculate_readability(self, text: str) -> float:
         """
@@ -281,7 +315,7 @@ class TextProcessor:
             Readability score (0-100, higher is easier to read)
         """
         # Count sentences
-        sentences = re.split(r'[.!?]+', text)
+        sentences = SENTENCE_SPLIT_RE.split(text)
         num_sentences = len([s for s in sentences if s.strip()])
 
         # Count words
@@ -305,15 +339,7 @@ class TextProcessor:
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word (simple approximation)."""
         word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        previous_was_vowel = False
-
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
+        syllable_count = len(VOWEL_GROUP_RE.findall(word))
 
         # Adjust for silent e
         if word.endswith('e'):
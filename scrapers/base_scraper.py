@@ -1,28 +1,110 @@
 """
 Base scraper class with common functionality for all platform scrapers.
 """
+import asyncio
 import hashlib
+import re
 import requests
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Set
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
+import aiohttp
+from dateutil import parser as date_parser
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # lxml is optional; fall back to the pure-Python parser
+    HTML_PARSER = 'html.parser'
+
 from config.settings import (
+    DATA_DIR,
     DEFAULT_HEADERS,
     REQUEST_TIMEOUT,
     MAX_RETRIES,
+    MAX_WORKERS,
     RATE_LIMIT_CALLS,
     RATE_LIMIT_PERIOD
 )
 from utils.rate_limiter import RateLimiter
+from utils.json_cache import JsonCache
+from utils.response_cache import ResponseCache
+
+# Connection pool sizing for the shared requests session
+POOL_CONNECTIONS = 64
+POOL_MAXSIZE = 64
+
+# Scheme and netloc of an absolute URL, as urlparse would split them
+URL_ORIGIN_RE = re.compile(r'([a-zA-Z][a-zA-Z0-9+.-]*)://([^/?#]*)')
+
+# robots.txt bodies are shared across scrapers and runs for a day
+ROBOTS_CACHE = JsonCache(DATA_DIR / 'robots_cache.json', ttl=24 * 60 * 60)
+
+# Article/chapter pages, revalidated with conditional GETs on later runs
+# for a month, after which they are downloaded again (and old rows pruned)
+RESPONSE_CACHE = ResponseCache(DATA_DIR / 'response_cache.sqlite', ttl=30 * 24 * 60 * 60)
+
+
+def parse_date(date_str: str) -> datetime:
+    """
+    Parse a date string from a page.
+
+    ISO 8601 values (``<time datetime>``, ``article:published_time``) take
+    the fast ``datetime.fromisoformat`` path; anything else goes through
+    dateutil.
+
+    Raises:
+        ValueError: If the string is not a recognizable date
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return date_parser.parse(date_str)
+
+
+@lru_cache(maxsize=1)
+def shared_session() -> requests.Session:
+    """
+    Get the process-wide requests session with retry logic.
+
+    All scrapers share it, so kept-alive connections (and their TLS
+    handshakes) are reused across platforms and authors hitting the same
+    host; the pool is safe to use from several threads.
+    """
+    session = requests.Session()
+
+    # Configure retry strategy
+    retry_strategy = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
+    )
+
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Set default headers
+    session.headers.update(DEFAULT_HEADERS)
+
+    return session
 
 
 class BaseScraper(ABC):
@@ -40,8 +122,8 @@ class BaseScraper(ABC):
         self.author_config = author_config
         self.author_name = author_config.get('name', author_id)
 
-        # Set up session with retry logic
-        self.session = self._create_session()
+        # Shared session with retry logic and connection pooling
+        self.session = shared_session()
 
         # Rate limiter
         self.rate_limiter = RateLimiter(RATE_LIMIT_CALLS, RATE_LIMIT_PERIOD)
@@ -49,7 +131,15 @@ class BaseScraper(ABC):
         # Robot parser cache
         self.robot_parsers: Dict[str, RobotFileParser] = {}
 
-        # Statistics
+        # URLs already stored; scrapers drop these before fetching them
+        self.skip_urls: Set[str] = set()
+
+        # Pages fetched by this scraper, across every blog/book it walks
+        self._seen_lock = threading.Lock()
+        self.seen_urls: Set[str] = set()
+
+        # Statistics (update through _increment_stat, which is thread-safe)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'total_requests': 0,
             'successful_requests': 0,
@@ -60,27 +150,6 @@ class BaseScraper(ABC):
 
         logger.info(f"Initialized {self.__class__.__name__} for {self.author_name}")
 
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic."""
-        session = requests.Session()
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=MAX_RETRIES,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Set default headers
-        session.headers.update(DEFAULT_HEADERS)
-
-        return session
-
     def _get_robot_parser(self, url: str) -> Optional[RobotFileParser]:
         """
         Get robot parser for a domain.
@@ -91,23 +160,60 @@ class BaseScraper(ABC):
         Returns:
             RobotFileParser instance or None if unavailable
         """
-        parsed_url = urlparse(url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        match = URL_ORIGIN_RE.match(url)
+        if match:
+            base_url = f"{match.group(1).lower()}://{match.group(2)}"
+        else:
+            parsed_url = urlparse(url)
+            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
         if base_url not in self.robot_parsers:
             robots_url = f"{base_url}/robots.txt"
             try:
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                rp.read()
-                self.robot_parsers[base_url] = rp
-                logger.debug(f"Loaded robots.txt from {robots_url}")
+                robots = ROBOTS_CACHE.get(base_url)
+                if robots is None:
+                    robots = self._fetch_robots(robots_url)
+                    # Server errors are transient; only cache real answers
+                    if robots['status'] < 500:
+                        ROBOTS_CACHE.set(base_url, robots)
+                    logger.debug(f"Loaded robots.txt from {robots_url}")
+
+                self.robot_parsers[base_url] = self._build_robot_parser(robots_url, robots)
             except Exception as e:
                 logger.warning(f"Could not load robots.txt from {robots_url}: {e}")
                 self.robot_parsers[base_url] = None
 
         return self.robot_parsers[base_url]
 
+    def _fetch_robots(self, robots_url: str) -> Dict[str, Any]:
+        """
+        Download robots.txt over the scraper's session.
+
+        Returns:
+            Dict with the HTTP status and body
+
+        Raises:
+            requests.RequestException: On network errors
+        """
+        response = self.session.get(robots_url, timeout=REQUEST_TIMEOUT)
+        return {'status': response.status_code, 'text': response.text}
+
+    @staticmethod
+    def _build_robot_parser(robots_url: str, robots: Dict[str, Any]) -> RobotFileParser:
+        """Build a parser from a cached robots.txt response (as RobotFileParser.read would)."""
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
+
+        status = robots['status']
+        if status in (401, 403) or status >= 500:
+            rp.disallow_all = True
+        elif 400 <= status < 500:
+            rp.allow_all = True
+        else:
+            rp.parse(robots['text'].splitlines())
+
+        return rp
+
     def can_fetch(self, url: str) -> bool:
         """
         Check if URL can be fetched according to robots.txt.
@@ -157,18 +263,198 @@ class BaseScraper(ABC):
 
         # Make request
         try:
-            self.stats['total_requests'] += 1
+            self._increment_stat('total_requests')
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-            self.stats['successful_requests'] += 1
+            self._increment_stat('successful_requests')
             logger.debug(f"Successfully fetched {url}")
             return response
 
         except requests.RequestException as e:
-            self.stats['failed_requests'] += 1
+            self._increment_stat('failed_requests')
+            logger.error(f"Failed to fetch {url}: {e}")
+            raise
+
+    def fetch_page(self, url: str) -> bytes:
+        """
+        Fetch a page body, revalidating a cached copy if there is one.
+
+        A page stored on an earlier run is requested with its ``ETag`` /
+        ``Last-Modified`` validators; on ``304 Not Modified`` the stored
+        body is returned without downloading it again.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Page body
+        """
+        headers = RESPONSE_CACHE.conditional_headers(url)
+        response = self.fetch_url(url, headers=headers)
+
+        if response.status_code == 304:
+            cached = RESPONSE_CACHE.get(url)
+            if cached is not None:
+                logger.debug(f"Not modified, using cached copy of {url}")
+                return cached['body']
+            # Entry vanished since the lookup; fetch unconditionally
+            response = self.fetch_url(url)
+
+        body = response.content
+        RESPONSE_CACHE.set(
+            url,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            body
+        )
+        return body
+
+    def _map_concurrent(
+        self,
+        func: Callable[[Any], Any],
+        items: List[Any],
+        max_workers: int = MAX_WORKERS
+    ) -> List[Any]:
+        """
+        Call ``func`` on each item from a thread pool.
+
+        Meant for per-page fetch+parse work; rate limiting and robots.txt
+        still apply through :meth:`fetch_url`.
+
+        Args:
+            func: Function of one item
+            items: Items to process
+            max_workers: Maximum number of calls in flight at once
+
+        Returns:
+            Results in the same order as ``items``
+        """
+        if max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _create_async_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session for concurrent fetches."""
+        return aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=aiohttp.TCPConnector(limit=MAX_WORKERS, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        )
+
+    @retry(
+        stop=stop_after_attempt(MAX_RETRIES),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError))
+    )
+    async def afetch_url(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """
+        Fetch a URL asynchronously with retry logic and rate limiting.
+
+        Async counterpart of :meth:`fetch_page`: robots.txt, the rate
+        limiter and the response cache are applied the same way (in a
+        worker thread, since all of them may block).
+
+        Args:
+            session: aiohttp session to fetch with
+            url: URL to fetch
+
+        Returns:
+            Response body
+
+        Raises:
+            aiohttp.ClientError: If request fails after retries
+        """
+        # Check robots.txt
+        if not await asyncio.to_thread(self.can_fetch, url):
+            logger.warning(f"URL blocked by robots.txt: {url}")
+            raise ValueError(f"URL blocked by robots.txt: {url}")
+
+        # Apply rate limiting
+        await asyncio.to_thread(self.rate_limiter.wait_if_needed)
+
+        headers = await asyncio.to_thread(RESPONSE_CACHE.conditional_headers, url)
+
+        # Make request
+        try:
+            self._increment_stat('total_requests')
+            async with session.get(url, headers=headers) as response:
+                response.raise_for_status()
+                not_modified = response.status == 304
+                body = b'' if not_modified else await response.read()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            self._increment_stat('successful_requests')
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self._increment_stat('failed_requests')
             logger.error(f"Failed to fetch {url}: {e}")
             raise
 
+        if not_modified:
+            cached = await asyncio.to_thread(RESPONSE_CACHE.get, url)
+            if cached is not None:
+                logger.debug(f"Not modified, using cached copy of {url}")
+                return cached['body']
+            raise aiohttp.ClientError(f"304 for {url} without a cached copy")
+
+        await asyncio.to_thread(RESPONSE_CACHE.set, url, etag, last_modified, body)
+        logger.debug(f"Successfully fetched {url}")
+        return body
+
+    async def afetch_all(
+        self,
+        urls: List[str],
+        concurrency: int = MAX_WORKERS,
+        parse: Optional[Callable[[str, bytes], Any]] = None,
+        executor: Optional[Executor] = None,
+        request_delay: float = 0
+    ) -> List[Any]:
+        """
+        Fetch several URLs concurrently.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum number of requests in flight at once
+            parse: Optional ``parse(url, body)`` run off the event loop as
+                each body arrives, so parsing overlaps the remaining fetches
+            executor: Executor to run ``parse`` in (a process pool needs a
+                picklable ``parse``); defaults to the loop's thread pool
+            request_delay: Seconds each request slot is held after its
+                response, as a politeness delay between requests
+
+        Returns:
+            Response bodies (or parse results) in the same order as ``urls``
+            (None for failures)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(session: aiohttp.ClientSession, url: str) -> Any:
+            async with semaphore:
+                try:
+                    body = await self.afetch_url(session, url)
+                except Exception as e:
+                    logger.warning(f"Giving up on {url}: {e}")
+                    return None
+                finally:
+                    if request_delay:
+                        await asyncio.sleep(request_delay)
+
+            if parse is None:
+                return body
+
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, parse, url, body
+                )
+            except Exception as e:
+                logger.warning(f"Failed to parse {url}: {e}")
+                return None
+
+        async with self._create_async_session() as session:
+            return await asyncio.gather(*(fetch(session, url) for url in urls))
+
     def generate_content_id(self, content: str, url: str = "") -> str:
         """
         Generate a unique ID for content.
@@ -180,8 +466,13 @@ class BaseScraper(ABC):
         Returns:
             Unique content ID
         """
-        combined = f"{url}:{content[:1000]}"
-        return hashlib.sha256(combined.encode()).hexdigest()
+        # Equivalent to sha256(f"{url}:{content[:1000]}"), fed incrementally
+        # so the combined string is never built. IDs are stored as primary
+        # keys, so the algorithm must stay SHA-256 to keep them stable.
+        digest = hashlib.sha256(url.encode())
+        digest.update(b':')
+        digest.update(content[:1000].encode())
+        return digest.hexdigest()
 
     def create_content_object(
         self,
@@ -257,14 +548,41 @@ class BaseScraper(ABC):
 
         return True
 
+    def claim_url(self, url: str) -> bool:
+        """
+        Mark a page as being scraped; safe to call from worker threads.
+
+        The same page can be reached twice in one run (e.g. a book excerpt
+        that is also a chapter), so callers check this before fetching.
+
+        Args:
+            url: Page URL (the ``#fragment`` is ignored)
+
+        Returns:
+            True the first time a URL is claimed, False afterwards
+        """
+        url = url.split('#', 1)[0]
+        with self._seen_lock:
+            if url in self.seen_urls:
+                return False
+            self.seen_urls.add(url)
+            return True
+
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Add to a statistics counter; safe to call from worker threads."""
+        with self._stats_lock:
+            self.stats[key] += amount
+
     def get_stats(self) -> Dict[str, int]:
         """Get scraper statistics."""
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
 
     def reset_stats(self):
         """Reset scraper statistics."""
-        for key in self.stats:
-            self.stats[key] = 0
+        with self._stats_lock:
+            for key in self.stats:
+                self.stats[key] = 0
 
     @abstractmethod
     def scrape(self, **kwargs) -> List[Dict[str, Any]]:
@@ -283,8 +601,7 @@ class BaseScraper(ABC):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close session."""
-        self.session.close()
+        """Context manager exit (the shared session stays open for other scrapers)."""
         if exc_type:
             logger.error(f"Scraper exited with error: {exc_val}")
         return False
@@ -1,18 +1,87 @@
 """
 Blog scraper for extracting articles from tim.blog and balajis.com.
 """
+import os
 import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Set
+from datetime import datetime, timezone
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
-from dateutil import parser as date_parser
 
-from scrapers.base_scraper import BaseScraper
-from config.settings import BLOG_SETTINGS, BLOG_SELECTORS
-from utils.rate_limiter import delay
+from scrapers.base_scraper import BaseScraper, HTML_PARSER, parse_date
+from config.settings import (
+    BLOG_SETTINGS,
+    BLOG_SELECTORS,
+    PROCESS_START_METHOD
+)
+
+# Selectors are fixed at import time, so compile them once instead of
+# re-parsing the CSS on every page.
+COMPILED_BLOG_SELECTORS = {
+    domain: {key: sv.compile(selector) for key, selector in selectors.items()}
+    for domain, selectors in BLOG_SELECTORS.items()
+}
+
+FALLBACK_TITLE_SELECTORS = [
+    sv.compile(sel) for sel in ['h1.entry-title', 'h1.post-title', 'h1', 'title']
+]
+FALLBACK_CONTENT_SELECTORS = [
+    sv.compile(sel) for sel in ['div.entry-content', 'div.post-content', 'article', 'main']
+]
+FALLBACK_DATE_SELECTORS = [
+    sv.compile(sel) for sel in ['time', 'meta[property="article:published_time"]', '.entry-date']
+]
+TAG_SELECTOR = sv.compile('.tag, .tags a, [rel="tag"]')
+CATEGORY_SELECTOR = sv.compile('.category, .categories a, [rel="category"]')
+
+# Post <article> elements on tim.blog index pages
+POST_CLASS_RE = re.compile('post-')
+
+# Index pages are only read for their links, so only these parts are parsed
+POST_ARTICLE_STRAINER = SoupStrainer('article', class_=POST_CLASS_RE)
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Links to skip while enumerating articles (substring matches)
+BALAJIS_EXCLUDE_RE = re.compile('#|tag|category|page')
+GENERIC_EXCLUDE_RE = re.compile('#|tag|category|author|page')
+
+# Elements dropped from article content before taking its text
+UNWANTED_TAGS = ['script', 'style', 'nav', 'footer', 'aside']
+
+# Whitespace cleanup in _clean_content, one pass for both substitutions
+WHITESPACE_RE = re.compile(r'(\n\s*\n)|( +)')  # 1: blank lines, 2: runs of spaces
+
+
+def _whitespace_replacement(match: re.Match) -> str:
+    return '\n\n' if match.lastindex == 1 else ' '
+
+
+def _url_origin(url: str) -> str:
+    """Scheme and host of a URL, e.g. ``https://tim.blog``."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _join_url(origin: str, base_url: str, href: str) -> str:
+    """
+    Resolve a link against the page URL.
+
+    Absolute and root-relative links (nearly all links on an index page)
+    are resolved without the full parse ``urljoin`` does on every call.
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//'):
+        return origin + href
+    return urljoin(base_url, href)
 
 
 class BlogScraper(BaseScraper):
@@ -27,7 +96,8 @@ class BlogScraper(BaseScraper):
         self,
         max_pages: Optional[int] = None,
         date_from: Optional[datetime] = None,
-        date_to: Optional[datetime] = None
+        date_to: Optional[datetime] = None,
+        skip_urls: Optional[Set[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Scrape blog posts.
@@ -36,11 +106,13 @@ class BlogScraper(BaseScraper):
             max_pages: Maximum number of pages to scrape
             date_from: Start date for filtering
             date_to: End date for filtering
+            skip_urls: Article URLs to skip without fetching (e.g. already stored)
 
         Returns:
             List of content objects
         """
         all_content = []
+        self.skip_urls = skip_urls or set()
 
         for blog in self.blogs:
             blog_url = blog.get('url')
@@ -66,6 +138,45 @@ class BlogScraper(BaseScraper):
 
         return all_content
 
+    async def scrape_async(
+        self,
+        max_pages: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        skip_urls: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape blog posts, fetching article pages concurrently.
+
+        Same arguments and result as :meth:`scrape`.
+        """
+        all_content = []
+        self.skip_urls = skip_urls or set()
+
+        for blog in self.blogs:
+            blog_url = blog.get('url')
+            blog_name = blog.get('name')
+
+            logger.info(f"Scraping blog: {blog_name} ({blog_url})")
+
+            try:
+                content = await self._scrape_blog_async(
+                    blog_url,
+                    blog_name,
+                    max_pages=max_pages or BLOG_SETTINGS['max_pages'],
+                    date_from=date_from,
+                    date_to=date_to
+                )
+                all_content.extend(content)
+
+            except Exception as e:
+                logger.error(f"Failed to scrape {blog_name}: {e}", exc_info=True)
+
+        logger.info(f"Scraped {len(all_content)} blog posts for {self.author_name}")
+        self.stats['items_scraped'] = len(all_content)
+
+        return all_content
+
     def _scrape_blog(
         self,
         blog_url: str,
@@ -81,97 +192,289 @@ class BlogScraper(BaseScraper):
         domain = urlparse(blog_url).netloc.replace('www.', '')
 
         # Get article URLs from archive/index pages
-        article_urls = self._get_article_urls(blog_url, domain, max_pages)
+        article_urls = self._get_article_urls(
+            blog_url, domain, max_pages, date_from, date_to
+        )
 
         logger.info(f"Found {len(article_urls)} article URLs from {blog_name}")
 
-        # Scrape each article
-        for url in article_urls:
+        def scrape_article(url: str) -> Optional[Dict[str, Any]]:
             try:
                 article = self._scrape_article(url, domain, blog_name)
 
-                if article:
-                    # Filter by date if specified
-                    if date_from or date_to:
-                        article_date = article.get('date_published')
-                        if article_date:
-                            article_dt = date_parser.parse(article_date)
-                            if date_from and article_dt < date_from:
-                                continue
-                            if date_to and article_dt > date_to:
-                                continue
-
-                    if self.validate_content(article):
-                        articles.append(article)
-                        self.stats['items_scraped'] += 1
-                    else:
-                        self.stats['items_filtered'] += 1
-
                 # Be respectful with delays
-                delay(BLOG_SETTINGS['delay_between_requests'])
+                time.sleep(BLOG_SETTINGS['delay_between_requests'])
+
+                return article
 
             except Exception as e:
                 logger.warning(f"Failed to scrape article {url}: {e}")
+                return None
+
+        # Scrape articles a few at a time (all from the same host)
+        for article in self._map_concurrent(
+            scrape_article,
+            article_urls,
+            max_workers=BLOG_SETTINGS['max_concurrent_requests']
+        ):
+            if article and self._accept_article(article, date_from, date_to):
+                articles.append(article)
+
+        return articles
+
+    async def _scrape_blog_async(
+        self,
+        blog_url: str,
+        blog_name: str,
+        max_pages: int,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Scrape a specific blog, fetching article pages concurrently."""
+        articles = []
+
+        # Get domain for selector lookup
+        domain = urlparse(blog_url).netloc.replace('www.', '')
+
+        # Index pages are paginated sequentially, so enumerate them off the loop
+        article_urls = await asyncio.to_thread(
+            self._get_article_urls, blog_url, domain, max_pages, date_from, date_to
+        )
+        article_urls = [url for url in article_urls if self.claim_url(url)]
+
+        logger.info(f"Found {len(article_urls)} article URLs from {blog_name}")
+
+        if not article_urls:
+            return articles
+
+        # Pages are parsed in worker processes while the remaining fetches run
+        with ProcessPoolExecutor(
+            max_workers=min(len(article_urls), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(PROCESS_START_METHOD)
+        ) as pool:
+            extracted = await self.afetch_all(
+                article_urls,
+                concurrency=BLOG_SETTINGS['max_concurrent_requests'],
+                parse=partial(BlogScraper.extract_article, domain=domain),
+                executor=pool,
+                request_delay=BLOG_SETTINGS['delay_between_requests']
+            )
+
+        for url, fields in zip(article_urls, extracted):
+            if fields is None:
                 continue
 
+            article = self._build_article(url, fields, domain, blog_name)
+            if self._accept_article(article, date_from, date_to):
+                articles.append(article)
+
         return articles
 
-    def _get_article_urls(self, base_url: str, domain: str, max_pages: int) -> List[str]:
-        """Get article URLs from blog index/archive pages."""
+    def _accept_article(
+        self,
+        article: Dict[str, Any],
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> bool:
+        """
+        Apply date filters and content validation to a scraped article.
+
+        Errors are contained to this article, so one bad page doesn't
+        discard the rest of the blog.
+        """
+        try:
+            # Filter by date if specified
+            if date_from or date_to:
+                article_date = article.get('date_published')
+                if article_date:
+                    # Always written by create_content_object via isoformat();
+                    # compared as naive UTC, like the CLI's date bounds
+                    article_dt = datetime.fromisoformat(article_date)
+                    if article_dt.tzinfo is not None:
+                        article_dt = article_dt.astimezone(timezone.utc).replace(tzinfo=None)
+                    if date_from and article_dt < date_from:
+                        return False
+                    if date_to and article_dt > date_to:
+                        return False
+
+            if self.validate_content(article):
+                self._increment_stat('items_scraped')
+                return True
+
+        except Exception as e:
+            logger.warning(f"Failed to filter article {article.get('url')}: {e}")
+
+        self._increment_stat('items_filtered')
+        return False
+
+    def _get_article_urls(
+        self,
+        base_url: str,
+        domain: str,
+        max_pages: int,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Get article URLs from blog index/archive pages.
+
+        Where the index shows a date per article, articles outside
+        ``date_from``/``date_to`` are dropped here, before they are fetched.
+        """
         article_urls = set()
 
         # Try different strategies based on the blog
         if 'tim.blog' in domain:
-            article_urls = self._get_tim_blog_urls(base_url, max_pages)
+            listed = self._get_tim_blog_urls(base_url, max_pages, date_from)
+            article_urls = [
+                url for url, listed_date in listed.items()
+                if self._listed_in_range(listed_date, date_from, date_to)
+            ]
+            if len(article_urls) < len(listed):
+                out_of_range = len(listed) - len(article_urls)
+                self._increment_stat('items_filtered', out_of_range)
+                logger.info(f"Skipping {out_of_range} articles listed outside the date range")
         elif 'balajis.com' in domain:
             article_urls = self._get_balajis_blog_urls(base_url, max_pages)
         else:
             # Generic approach
             article_urls = self._get_generic_blog_urls(base_url, max_pages)
 
+        # Skip articles we already have before spending a request on them
+        if self.skip_urls:
+            known = len(article_urls)
+            article_urls = [url for url in article_urls if url not in self.skip_urls]
+            logger.info(f"Skipping {known - len(article_urls)} already scraped articles")
+
         return list(article_urls)
 
-    def _get_tim_blog_urls(self, base_url: str, max_pages: int) -> set:
-        """Get article URLs from tim.blog."""
-        urls = set()
+    def _get_tim_blog_urls(
+        self,
+        base_url: str,
+        max_pages: int,
+        date_from: Optional[datetime] = None
+    ) -> Dict[str, Optional[datetime]]:
+        """
+        Get article URLs from tim.blog, with the date each is listed under.
+
+        Index pages are fetched concurrently in batches of
+        ``BLOG_SETTINGS['max_concurrent_requests']`` and read in page order.
+        Pagination stops at the first page that is empty, fails, adds no
+        new URLs or (the index being newest first) only lists articles
+        older than ``date_from``; at most one batch is over-fetched.
+        """
+        urls = {}
+        batch_size = BLOG_SETTINGS['max_concurrent_requests']
 
         # Tim Ferriss blog uses WordPress pagination
-        for page_num in range(1, max_pages + 1):
-            page_url = f"{base_url}/page/{page_num}/" if page_num > 1 else base_url
+        for first_page in range(1, max_pages + 1, batch_size):
+            page_nums = list(range(first_page, min(first_page + batch_size, max_pages + 1)))
+            pages = self._map_concurrent(
+                lambda page_num: self._read_tim_index_page(base_url, page_num),
+                page_nums,
+                max_workers=batch_size
+            )
 
-            try:
-                response = self.fetch_url(page_url)
-                soup = BeautifulSoup(response.content, 'html.parser')
+            for page_num, entries in zip(page_nums, pages):
+                if entries is None:
+                    return urls
 
-                # Find article links
-                articles = soup.find_all('article', class_=re.compile('post-'))
-                if not articles:
+                if not entries:
                     logger.info(f"No more articles found at page {page_num}")
-                    break
+                    return urls
 
-                for article in articles:
-                    # Get the permalink
-                    title_link = article.find('h2', class_='entry-title')
-                    if title_link:
-                        link = title_link.find('a')
-                        if link and link.get('href'):
-                            urls.add(link['href'])
+                known = len(urls)
+                urls.update(entries)
 
-                logger.debug(f"Found {len(articles)} articles on page {page_num}")
+                if len(urls) == known:
+                    logger.info(f"No new articles on page {page_num}, stopping")
+                    return urls
 
-            except Exception as e:
-                logger.warning(f"Failed to fetch page {page_num}: {e}")
-                break
+                if date_from and all(
+                    listed_date and listed_date < date_from for _, listed_date in entries
+                ):
+                    logger.info(f"Page {page_num} predates {date_from:%Y-%m-%d}, stopping")
+                    return urls
 
         return urls
 
+    def _read_tim_index_page(
+        self,
+        base_url: str,
+        page_num: int
+    ) -> Optional[List[tuple]]:
+        """
+        Fetch one tim.blog index page.
+
+        Returns:
+            ``(url, listed date)`` for each article on the page, or None if
+            the page could not be fetched
+        """
+        page_url = f"{base_url}/page/{page_num}/" if page_num > 1 else base_url
+
+        try:
+            response = self.fetch_url(page_url)
+            soup = BeautifulSoup(
+                response.content, HTML_PARSER, parse_only=POST_ARTICLE_STRAINER
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch page {page_num}: {e}")
+            return None
+
+        # Find article links
+        articles = soup.find_all('article', class_=POST_CLASS_RE)
+
+        entries = []
+        for article in articles:
+            # Get the permalink
+            title_link = article.find('h2', class_='entry-title')
+            if title_link:
+                link = title_link.find('a')
+                if link and link.get('href'):
+                    entries.append((link['href'], self._listing_date(article)))
+
+        logger.debug(f"Found {len(articles)} articles on page {page_num}")
+        return entries
+
+    @staticmethod
+    def _listed_in_range(
+        listed_date: Optional[datetime],
+        date_from: Optional[datetime],
+        date_to: Optional[datetime]
+    ) -> bool:
+        """Whether an index-page date is inside the window (undated articles pass)."""
+        if listed_date is None:
+            return True
+        if date_from and listed_date < date_from:
+            return False
+        if date_to and listed_date > date_to:
+            return False
+        return True
+
+    @staticmethod
+    def _listing_date(article) -> Optional[datetime]:
+        """Read the ``<time datetime=...>`` of an index-page article (naive UTC)."""
+        time_elem = article.find('time', datetime=True)
+        if not time_elem:
+            return None
+        try:
+            listed = datetime.fromisoformat(time_elem['datetime'])
+        except ValueError:
+            return None
+        if listed.tzinfo is not None:
+            listed = listed.astimezone(timezone.utc).replace(tzinfo=None)
+        return listed
+
     def _get_balajis_blog_urls(self, base_url: str, max_pages: int) -> set:
         """Get article URLs from balajis.com."""
         urls = set()
 
         try:
             response = self.fetch_url(base_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=LINK_STRAINER)
+
+            origin = _url_origin(base_url)
 
             # Find all article links
             links = soup.find_all('a', href=True)
@@ -179,9 +482,9 @@ class BlogScraper(BaseScraper):
                 href = link['href']
                 # Filter for article URLs
                 if href.startswith('/') or base_url in href:
-                    full_url = urljoin(base_url, href)
+                    full_url = _join_url(origin, base_url, href)
                     # Exclude non-article pages
-                    if not any(x in full_url for x in ['#', 'tag', 'category', 'page']):
+                    if not BALAJIS_EXCLUDE_RE.search(full_url):
                         urls.add(full_url)
 
         except Exception as e:
@@ -195,16 +498,18 @@ class BlogScraper(BaseScraper):
 
         try:
             response = self.fetch_url(base_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=LINK_STRAINER)
+
+            origin = _url_origin(base_url)
 
             # Look for common article link patterns
             for link in soup.find_all('a', href=True):
                 href = link['href']
-                full_url = urljoin(base_url, href)
+                full_url = _join_url(origin, base_url, href)
 
                 # Basic heuristics for article URLs
                 if (full_url.startswith(base_url) and
-                    not any(x in full_url for x in ['#', 'tag', 'category', 'author', 'page'])):
+                    not GENERIC_EXCLUDE_RE.search(full_url)):
                     urls.add(full_url)
 
         except Exception as e:
@@ -214,126 +519,173 @@ class BlogScraper(BaseScraper):
 
     def _scrape_article(self, url: str, domain: str, blog_name: str) -> Optional[Dict[str, Any]]:
         """Scrape a single article."""
-        try:
-            response = self.fetch_url(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+        if not self.claim_url(url):
+            logger.debug(f"Already scraped in this run: {url}")
+            return None
 
-            # Get selectors for this domain
-            selectors = BLOG_SELECTORS.get(domain, {})
+        try:
+            html = self.fetch_page(url)
+            return self._parse_article(url, html, domain, blog_name)
 
-            # Extract title
-            title = self._extract_title(soup, selectors)
+        except Exception as e:
+            logger.error(f"Failed to scrape article {url}: {e}", exc_info=True)
+            return None
 
-            # Extract content
-            content = self._extract_content(soup, selectors)
+    def _parse_article(
+        self,
+        url: str,
+        html: bytes,
+        domain: str,
+        blog_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Build a content object from a fetched article page."""
+        fields = self.extract_article(url, html, domain)
+        if fields is None:
+            return None
+        return self._build_article(url, fields, domain, blog_name)
 
-            # Extract date
-            date_published = self._extract_date(soup, selectors)
+    @staticmethod
+    def extract_article(url: str, html: bytes, domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the title, content, date, tags and categories of an article page.
 
-            # Extract metadata
-            metadata = {
-                'blog_name': blog_name,
-                'domain': domain,
-                'tags': self._extract_tags(soup),
-                'categories': self._extract_categories(soup)
-            }
+        Uses no scraper state, so it can run in a worker process.
 
-            if not title or not content:
-                logger.warning(f"Missing title or content for {url}")
-                return None
+        Returns:
+            Dict of extracted fields, or None if the title or content is
+            missing or the page could not be parsed
+        """
+        try:
+            soup = BeautifulSoup(html, HTML_PARSER)
 
-            # Create content object
-            return self.create_content_object(
-                title=title,
-                content=content,
-                url=url,
-                date_published=date_published,
-                platform='blog',
-                content_type='article',
-                metadata=metadata
-            )
+            # Get selectors for this domain
+            selectors = COMPILED_BLOG_SELECTORS.get(domain, {})
+
+            fields = {
+                'title': BlogScraper._extract_title(soup, selectors),
+                'content': BlogScraper._extract_content(soup, selectors),
+                'date_published': BlogScraper._extract_date(soup, selectors),
+                'tags': BlogScraper._extract_tags(soup),
+                'categories': BlogScraper._extract_categories(soup)
+            }
 
         except Exception as e:
-            logger.error(f"Failed to scrape article {url}: {e}", exc_info=True)
+            logger.error(f"Failed to parse article {url}: {e}", exc_info=True)
             return None
 
-    def _extract_title(self, soup: BeautifulSoup, selectors: Dict) -> str:
+        if not fields['title'] or not fields['content']:
+            logger.warning(f"Missing title or content for {url}")
+            return None
+
+        return fields
+
+    def _build_article(
+        self,
+        url: str,
+        fields: Dict[str, Any],
+        domain: str,
+        blog_name: str
+    ) -> Dict[str, Any]:
+        """Create the content object for an article from its extracted fields."""
+        metadata = {
+            'blog_name': blog_name,
+            'domain': domain,
+            'tags': fields['tags'],
+            'categories': fields['categories']
+        }
+
+        return self.create_content_object(
+            title=fields['title'],
+            content=fields['content'],
+            url=url,
+            date_published=fields['date_published'],
+            platform='blog',
+            content_type='article',
+            metadata=metadata
+        )
+
+    @staticmethod
+    def _extract_title(soup: BeautifulSoup, selectors: Dict) -> str:
         """Extract article title."""
         # Try selector
         if 'title' in selectors:
-            title_elem = soup.select_one(selectors['title'])
+            title_elem = selectors['title'].select_one(soup)
             if title_elem:
                 return title_elem.get_text(strip=True)
 
         # Fallback: try common patterns
-        for selector in ['h1.entry-title', 'h1.post-title', 'h1', 'title']:
-            elem = soup.select_one(selector)
+        for selector in FALLBACK_TITLE_SELECTORS:
+            elem = selector.select_one(soup)
             if elem:
                 return elem.get_text(strip=True)
 
         return ""
 
-    def _extract_content(self, soup: BeautifulSoup, selectors: Dict) -> str:
+    @staticmethod
+    def _extract_content(soup: BeautifulSoup, selectors: Dict) -> str:
         """Extract article content."""
         # Try selector
         if 'content' in selectors:
-            content_elem = soup.select_one(selectors['content'])
+            content_elem = selectors['content'].select_one(soup)
             if content_elem:
-                return self._clean_content(content_elem)
+                return BlogScraper._clean_content(content_elem)
 
         # Fallback: try common patterns
-        for selector in ['div.entry-content', 'div.post-content', 'article', 'main']:
-            elem = soup.select_one(selector)
+        for selector in FALLBACK_CONTENT_SELECTORS:
+            elem = selector.select_one(soup)
             if elem:
-                return self._clean_content(elem)
+                return BlogScraper._clean_content(elem)
 
         return ""
 
-    def _clean_content(self, element) -> str:
+    @staticmethod
+    def _clean_content(element) -> str:
         """Clean and extract text from content element."""
-        # Remove script and style elements
-        for script in element(['script', 'style', 'nav', 'footer', 'aside']):
-            script.decompose()
+        # Remove script and style elements; detaching is enough, as the
+        # soup is thrown away after extraction (decompose walks each subtree)
+        for script in element(UNWANTED_TAGS):
+            script.extract()
 
         # Get text with some structure preserved
         text = element.get_text(separator='\n', strip=True)
 
         # Clean up extra whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = WHITESPACE_RE.sub(_whitespace_replacement, text)
 
         return text.strip()
 
-    def _extract_date(self, soup: BeautifulSoup, selectors: Dict) -> Optional[datetime]:
+    @staticmethod
+    def _extract_date(soup: BeautifulSoup, selectors: Dict) -> Optional[datetime]:
         """Extract publication date."""
         # Try selector
         if 'date' in selectors:
-            date_elem = soup.select_one(selectors['date'])
+            date_elem = selectors['date'].select_one(soup)
             if date_elem:
                 date_str = date_elem.get('datetime') or date_elem.get_text(strip=True)
                 try:
-                    return date_parser.parse(date_str)
+                    return parse_date(date_str)
                 except:
                     pass
 
         # Try common patterns
-        for selector in ['time', 'meta[property="article:published_time"]', '.entry-date']:
-            elem = soup.select_one(selector)
+        for selector in FALLBACK_DATE_SELECTORS:
+            elem = selector.select_one(soup)
             if elem:
                 date_str = elem.get('datetime') or elem.get('content') or elem.get_text(strip=True)
                 try:
-                    return date_parser.parse(date_str)
+                    return parse_date(date_str)
                 except:
                     pass
 
         return None
 
-    def _extract_tags(self, soup: BeautifulSoup) -> List[str]:
+    @staticmethod
+    def _extract_tags(soup: BeautifulSoup) -> List[str]:
         """Extract article tags."""
         tags = []
 
         # Try common tag patterns
-        tag_elems = soup.select('.tag, .tags a, [rel="tag"]')
+        tag_elems = TAG_SELECTOR.select(soup)
         for elem in tag_elems:
             tag = elem.get_text(strip=True)
             if tag:
@@ -341,12 +693,13 @@ class BlogScraper(BaseScraper):
 
         return tags
 
-    def _extract_categories(self, soup: BeautifulSoup) -> List[str]:
+    @staticmethod
+    def _extract_categories(soup: BeautifulSoup) -> List[str]:
         """Extract article categories."""
         categories = []
 
         # Try common category patterns
-        cat_elems = soup.select('.category, .categories a, [rel="category"]')
+        cat_elems = CATEGORY_SELECTOR.select(soup)
         for elem in cat_elems:
             cat = elem.get_text(strip=True)
             if cat:
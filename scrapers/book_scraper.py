@@ -2,15 +2,49 @@
 Book scraper for extracting content from publicly available books and excerpts.
 """
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
 
-from scrapers.base_scraper import BaseScraper
+from scrapers.base_scraper import BaseScraper, HTML_PARSER, parse_date
+from config.settings import BLOG_SETTINGS
+
+# Extraction selectors, compiled once instead of on every page
+TOC_SELECTORS = [
+    sv.compile(sel) for sel in [
+        'nav#TableOfContents',
+        'div.toc',
+        'ul.chapters',
+        'nav[role="navigation"]',
+        'div#toc'
+    ]
+]
+CHAPTER_CONTENT_SELECTORS = [
+    sv.compile(sel) for sel in ['article', 'main', 'div.content', 'div.chapter', 'div.post-content']
+]
+EXCERPT_CONTENT_SELECTOR = sv.compile('div.entry-content, div.post-content, article')
+EXCERPT_DATE_SELECTOR = sv.compile('time, .entry-date')
+
+# Excerpt index pages are only read for their <article> entries
+ARTICLE_STRAINER = SoupStrainer('article')
+
+# Elements dropped from chapter pages, and from any extracted content
+PAGE_CHROME_TAGS = ['nav', 'header', 'footer', 'script', 'style']
+UNWANTED_TAGS = ['script', 'style', 'nav', 'footer', 'aside', 'iframe']
+
+# Patterns used while walking index pages and cleaning text
+TITLE_CLASS_RE = re.compile('title')
+CHAPTER_LINK_RE = re.compile(r'\d|chapter', re.IGNORECASE)  # digits or "chapter"
+WHITESPACE_RE = re.compile(r'(\n\s*\n)|( +)')  # 1: blank lines, 2: runs of spaces
+
+
+def _whitespace_replacement(match: re.Match) -> str:
+    return '\n\n' if match.lastindex == 1 else ' '
 
 
 class BookScraper(BaseScraper):
@@ -27,7 +61,8 @@ class BookScraper(BaseScraper):
     def scrape(
         self,
         book_title: Optional[str] = None,
-        max_chapters: Optional[int] = None
+        max_chapters: Optional[int] = None,
+        skip_urls: Optional[Set[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Scrape book content.
@@ -35,11 +70,13 @@ class BookScraper(BaseScraper):
         Args:
             book_title: Specific book to scrape (None for all)
             max_chapters: Maximum chapters to scrape per book
+            skip_urls: Chapter/excerpt URLs to skip without fetching (e.g. already stored)
 
         Returns:
             List of content objects
         """
         all_content = []
+        self.skip_urls = skip_urls or set()
 
         for book in self.books:
             title = book.get('title')
@@ -92,7 +129,7 @@ class BookScraper(BaseScraper):
         try:
             # Fetch the main page
             response = self.fetch_url(book_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
 
             # Extract table of contents or chapter links
             chapter_links = self._find_chapter_links(soup, book_url)
@@ -103,25 +140,39 @@ class BookScraper(BaseScraper):
             if max_chapters:
                 chapter_links = chapter_links[:max_chapters]
 
-            # Scrape each chapter
-            for idx, (chapter_title, chapter_url) in enumerate(chapter_links, 1):
+            def scrape_chapter(chapter: tuple) -> Optional[Dict[str, Any]]:
+                idx, (chapter_title, chapter_url) = chapter
                 try:
-                    chapter_content = self._scrape_chapter(
+                    return self._scrape_chapter(
                         chapter_url,
                         chapter_title,
                         book_title,
                         idx
                     )
 
-                    if chapter_content and self.validate_content(chapter_content):
-                        content.append(chapter_content)
-                        self.stats['items_scraped'] += 1
-                    else:
-                        self.stats['items_filtered'] += 1
-
                 except Exception as e:
                     logger.warning(f"Failed to scrape chapter {chapter_title}: {e}")
-                    continue
+                    return None
+
+            # Number chapters by TOC position, then skip the ones already stored
+            chapters = [
+                chapter for chapter in enumerate(chapter_links, 1)
+                if chapter[1][1] not in self.skip_urls
+            ]
+            if len(chapters) < len(chapter_links):
+                logger.info(f"Skipping {len(chapter_links) - len(chapters)} already scraped chapters")
+
+            # Scrape chapters a few at a time, keeping TOC order
+            for chapter_content in self._map_concurrent(
+                scrape_chapter,
+                chapters,
+                max_workers=BLOG_SETTINGS['max_concurrent_requests']
+            ):
+                if chapter_content and self.validate_content(chapter_content):
+                    content.append(chapter_content)
+                    self._increment_stat('items_scraped')
+                else:
+                    self._increment_stat('items_filtered')
 
         except Exception as e:
             logger.error(f"Failed to scrape online book {book_title}: {e}", exc_info=True)
@@ -129,21 +180,26 @@ class BookScraper(BaseScraper):
         return content
 
     def _find_chapter_links(self, soup: BeautifulSoup, base_url: str) -> List[tuple]:
-        """Find chapter links in a book's table of contents."""
+        """
+        Find chapter links in a book's table of contents.
+
+        Links are deduplicated on their URL without the ``#fragment``, so
+        a page linked several times (or through in-page anchors) is
+        fetched once, under the first title it appears with.
+        """
         chapter_links = []
+        seen = set()
 
-        # Look for common TOC patterns
-        toc_selectors = [
-            'nav#TableOfContents',
-            'div.toc',
-            'ul.chapters',
-            'nav[role="navigation"]',
-            'div#toc'
-        ]
+        def add(title: str, href: str):
+            url = urljoin(base_url, href).split('#', 1)[0]
+            if url not in seen:
+                seen.add(url)
+                chapter_links.append((title, url))
 
+        # Look for common TOC patterns
         toc = None
-        for selector in toc_selectors:
-            toc = soup.select_one(selector)
+        for selector in TOC_SELECTORS:
+            toc = selector.select_one(soup)
             if toc:
                 break
 
@@ -155,16 +211,14 @@ class BookScraper(BaseScraper):
                 href = link['href']
                 text = link.get_text(strip=True)
                 # Heuristic: chapter links often contain numbers or "chapter"
-                if text and (re.search(r'\d+', text) or 'chapter' in text.lower()):
-                    full_url = urljoin(base_url, href)
-                    chapter_links.append((text, full_url))
+                if text and CHAPTER_LINK_RE.search(text):
+                    add(text, href)
         else:
             # Extract links from TOC
             for link in toc.find_all('a', href=True):
                 title = link.get_text(strip=True)
-                url = urljoin(base_url, link['href'])
                 if title:
-                    chapter_links.append((title, url))
+                    add(title, link['href'])
 
         return chapter_links
 
@@ -176,26 +230,22 @@ class BookScraper(BaseScraper):
         chapter_num: int
     ) -> Optional[Dict[str, Any]]:
         """Scrape a single chapter."""
+        if not self.claim_url(url):
+            logger.debug(f"Already scraped in this run: {url}")
+            return None
+
         try:
-            response = self.fetch_url(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            html = self.fetch_page(url)
+            soup = BeautifulSoup(html, HTML_PARSER)
 
             # Remove navigation, headers, footers
-            for elem in soup(['nav', 'header', 'footer', 'script', 'style']):
-                elem.decompose()
+            for elem in soup(PAGE_CHROME_TAGS):
+                elem.extract()
 
             # Find main content
             content = None
-            content_selectors = [
-                'article',
-                'main',
-                'div.content',
-                'div.chapter',
-                'div.post-content'
-            ]
-
-            for selector in content_selectors:
-                elem = soup.select_one(selector)
+            for selector in CHAPTER_CONTENT_SELECTORS:
+                elem = selector.select_one(soup)
                 if elem:
                     content = self._clean_text(elem)
                     break
@@ -250,14 +300,15 @@ class BookScraper(BaseScraper):
         try:
             # This is typically a blog category/tag page
             response = self.fetch_url(excerpts_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=ARTICLE_STRAINER)
 
             # Find article links
             articles = soup.find_all('article', limit=max_excerpts)
 
+            excerpt_links = []
             for article in articles:
                 # Get article link
-                title_elem = article.find(['h2', 'h3'], class_=re.compile('title'))
+                title_elem = article.find(['h2', 'h3'], class_=TITLE_CLASS_RE)
                 if not title_elem:
                     continue
 
@@ -265,26 +316,35 @@ class BookScraper(BaseScraper):
                 if not link or not link.get('href'):
                     continue
 
-                article_url = link['href']
-                article_title = link.get_text(strip=True)
+                if link['href'] in self.skip_urls:
+                    continue
+
+                excerpt_links.append((link['href'], link.get_text(strip=True)))
 
-                # Scrape the excerpt article
+            def scrape_excerpt(excerpt_link: tuple) -> Optional[Dict[str, Any]]:
+                article_url, article_title = excerpt_link
                 try:
-                    excerpt = self._scrape_excerpt_article(
+                    return self._scrape_excerpt_article(
                         article_url,
                         article_title,
                         book_title
                     )
 
-                    if excerpt and self.validate_content(excerpt):
-                        content.append(excerpt)
-                        self.stats['items_scraped'] += 1
-                    else:
-                        self.stats['items_filtered'] += 1
-
                 except Exception as e:
                     logger.warning(f"Failed to scrape excerpt {article_title}: {e}")
-                    continue
+                    return None
+
+            # Scrape the excerpt articles a few at a time
+            for excerpt in self._map_concurrent(
+                scrape_excerpt,
+                excerpt_links,
+                max_workers=BLOG_SETTINGS['max_concurrent_requests']
+            ):
+                if excerpt and self.validate_content(excerpt):
+                    content.append(excerpt)
+                    self._increment_stat('items_scraped')
+                else:
+                    self._increment_stat('items_filtered')
 
         except Exception as e:
             logger.error(f"Failed to scrape excerpts for {book_title}: {e}", exc_info=True)
@@ -298,25 +358,28 @@ class BookScraper(BaseScraper):
         book_title: str
     ) -> Optional[Dict[str, Any]]:
         """Scrape a blog post containing a book excerpt."""
+        if not self.claim_url(url):
+            logger.debug(f"Already scraped in this run: {url}")
+            return None
+
         try:
-            response = self.fetch_url(url)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            html = self.fetch_page(url)
+            soup = BeautifulSoup(html, HTML_PARSER)
 
             # Extract content
-            content_elem = soup.select_one('div.entry-content, div.post-content, article')
+            content_elem = EXCERPT_CONTENT_SELECTOR.select_one(soup)
             if not content_elem:
                 return None
 
             content = self._clean_text(content_elem)
 
             # Extract date
-            date_elem = soup.select_one('time, .entry-date')
+            date_elem = EXCERPT_DATE_SELECTOR.select_one(soup)
             published_date = None
             if date_elem:
                 date_str = date_elem.get('datetime') or date_elem.get_text(strip=True)
                 try:
-                    from dateutil import parser as date_parser
-                    published_date = date_parser.parse(date_str)
+                    published_date = parse_date(date_str)
                 except:
                     pass
 
@@ -344,15 +407,15 @@ class BookScraper(BaseScraper):
 
     def _clean_text(self, element) -> str:
         """Clean and extract text from HTML element."""
-        # Remove unwanted elements
-        for unwanted in element(['script', 'style', 'nav', 'footer', 'aside', 'iframe']):
-            unwanted.decompose()
+        # Remove unwanted elements; detaching is enough, as the soup is
+        # thrown away after extraction (decompose walks each subtree)
+        for unwanted in element(UNWANTED_TAGS):
+            unwanted.extract()
 
         # Get text
         text = element.get_text(separator='\n', strip=True)
 
         # Clean up whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = WHITESPACE_RE.sub(_whitespace_replacement, text)
 
         return text.strip()
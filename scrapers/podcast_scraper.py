@@ -1,15 +1,83 @@
 """
 Podcast scraper for extracting podcast episodes from RSS feeds.
 """
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import asyncio
+import copy
+import hashlib
+import html
+import os
+import re
+import shutil
+import tempfile
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Optional, Set
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 
 import feedparser
+from bs4 import BeautifulSoup
 from loguru import logger
 from dateutil import parser as date_parser
 
-from scrapers.base_scraper import BaseScraper
-from config.settings import PODCAST_SETTINGS
+from scrapers.base_scraper import BaseScraper, HTML_PARSER
+from config.settings import PODCAST_SETTINGS, RAW_DATA_DIR
+from utils.memory_cache import MemoryCache
+
+# itunes:duration as [[hours:]minutes:]seconds
+DURATION_RE = re.compile(r'(?:(?:(\d+):)?(\d+):)?(\d+)')
+
+# Audio files run to tens of MB; read them in large chunks
+AUDIO_CHUNK_SIZE = 1 << 20
+
+# Parsed feeds keyed by (URL, body digest) so raw bodies aren't kept alive;
+# parsed feeds are large, so only a handful are held at a time
+PARSED_FEED_CACHE = MemoryCache(4)
+
+
+def _parse_feed_body(rss_url: str, body: bytes) -> feedparser.FeedParserDict:
+    """
+    Parse a downloaded RSS feed, memoized on its URL and body digest.
+
+    An unchanged feed (e.g. re-read by ``get_episode_by_url``) is not
+    parsed again; each caller gets its own copy of the cached result.
+    Sanitizing and relative-URI resolution are turned off: they dominate
+    feedparser's parse time on large feeds, and episode summaries are
+    reduced to plain text anyway.
+    """
+    key = (rss_url, hashlib.sha256(body).digest())
+    feed = PARSED_FEED_CACHE.get(key)
+    if feed is None:
+        feed = feedparser.parse(
+            body,
+            response_headers={'content-location': rss_url},
+            sanitize_html=False,
+            resolve_relative_uris=False
+        )
+        PARSED_FEED_CACHE.set(key, feed)
+    return copy.deepcopy(feed)
+
+
+@lru_cache(maxsize=4096)
+def _parse_pub_date(date_str: str) -> datetime:
+    """
+    Parse an RSS ``pubDate`` that feedparser could not.
+
+    These are nearly always RFC 822 (``Tue, 02 Jan 2024 12:00:00 GMT``),
+    which ``email.utils`` handles far faster than dateutil; dateutil is
+    kept for anything else. Aware results are converted to naive UTC to
+    match ``published_parsed``. Feeds often repeat timestamps, hence the
+    cache.
+    """
+    try:
+        parsed = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        parsed = date_parser.parse(date_str)
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
 
 
 class PodcastScraper(BaseScraper):
@@ -28,7 +96,8 @@ class PodcastScraper(BaseScraper):
         max_episodes: int = 100,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
-        download_audio: bool = False
+        download_audio: bool = False,
+        skip_urls: Optional[Set[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Scrape podcast episodes.
@@ -38,37 +107,88 @@ class PodcastScraper(BaseScraper):
             date_from: Start date for filtering
             date_to: End date for filtering
             download_audio: Whether to download audio files
+            skip_urls: Episode URLs to skip without processing (e.g. already stored)
 
         Returns:
             List of content objects
         """
         all_content = []
+        self.skip_urls = skip_urls or set()
+        feeds = self._feed_sources()
 
-        for podcast in self.podcasts:
-            podcast_name = podcast.get('name', 'Unknown')
-            rss_url = podcast.get('rss_url')
+        def scrape_feed(feed: tuple) -> List[Dict[str, Any]]:
+            podcast_name, rss_url = feed
+            logger.info(f"Scraping podcast: {podcast_name} ({rss_url})")
 
-            if not rss_url:
-                # Try to search for podcast appearances
-                search_keywords = podcast.get('search_keywords', [])
-                if search_keywords:
-                    logger.info(f"Searching for podcast appearances with keywords: {search_keywords}")
-                    # This would require additional implementation for podcast search
-                    continue
-                else:
-                    logger.warning(f"No RSS URL or search keywords for podcast: {podcast_name}")
-                    continue
+            try:
+                return self._scrape_podcast(
+                    rss_url=rss_url,
+                    podcast_name=podcast_name,
+                    max_episodes=max_episodes,
+                    date_from=date_from,
+                    date_to=date_to,
+                    download_audio=download_audio or PODCAST_SETTINGS['download_audio']
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to scrape podcast {podcast_name}: {e}", exc_info=True)
+                return []
+
+        # Feeds are independent downloads, so fetch and parse several at once
+        for episodes in self._map_concurrent(
+            scrape_feed,
+            feeds,
+            max_workers=PODCAST_SETTINGS['parallel_feeds']
+        ):
+            all_content.extend(episodes)
+
+        logger.info(f"Scraped {len(all_content)} podcast episodes for {self.author_name}")
+        self.stats['items_scraped'] = len(all_content)
+
+        return all_content
+
+    async def scrape_async(
+        self,
+        max_episodes: int = 100,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        download_audio: bool = False,
+        skip_urls: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape podcast episodes, downloading all feeds concurrently.
 
+        Same arguments and result as :meth:`scrape`. Feeds are parsed off
+        the event loop as they arrive; episodes are then built one feed at
+        a time, which keeps audio downloads bounded per feed.
+        """
+        all_content = []
+        self.skip_urls = skip_urls or set()
+        feeds = self._feed_sources()
+
+        for podcast_name, rss_url in feeds:
             logger.info(f"Scraping podcast: {podcast_name} ({rss_url})")
 
+        parsed_feeds = await self.afetch_all(
+            [rss_url for _, rss_url in feeds],
+            concurrency=PODCAST_SETTINGS['parallel_feeds'],
+            parse=_parse_feed_body
+        )
+
+        for (podcast_name, rss_url), feed in zip(feeds, parsed_feeds):
+            if feed is None:
+                continue
+
             try:
-                episodes = self._scrape_podcast(
+                episodes = await asyncio.to_thread(
+                    self._scrape_podcast,
                     rss_url=rss_url,
                     podcast_name=podcast_name,
                     max_episodes=max_episodes,
                     date_from=date_from,
                     date_to=date_to,
-                    download_audio=download_audio or PODCAST_SETTINGS['download_audio']
+                    download_audio=download_audio or PODCAST_SETTINGS['download_audio'],
+                    feed=feed
                 )
                 all_content.extend(episodes)
 
@@ -80,6 +200,28 @@ class PodcastScraper(BaseScraper):
 
         return all_content
 
+    def _feed_sources(self) -> List[tuple]:
+        """Get ``(podcast_name, rss_url)`` for each configured podcast with a feed."""
+        feeds = []
+        for podcast in self.podcasts:
+            podcast_name = podcast.get('name', 'Unknown')
+            rss_url = podcast.get('rss_url')
+
+            if not rss_url:
+                # Try to search for podcast appearances
+                search_keywords = podcast.get('search_keywords', [])
+                if search_keywords:
+                    logger.info(f"Searching for podcast appearances with keywords: {search_keywords}")
+                    # This would require additional implementation for podcast search
+                    continue
+                else:
+                    logger.warning(f"No RSS URL or search keywords for podcast: {podcast_name}")
+                    continue
+
+            feeds.append((podcast_name, rss_url))
+
+        return feeds
+
     def _scrape_podcast(
         self,
         rss_url: str,
@@ -87,14 +229,17 @@ class PodcastScraper(BaseScraper):
         max_episodes: int,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
-        download_audio: bool = False
+        download_audio: bool = False,
+        feed: Optional[feedparser.FeedParserDict] = None
     ) -> List[Dict[str, Any]]:
-        """Scrape episodes from a specific podcast feed."""
+        """Scrape episodes from a specific podcast feed (fetched unless ``feed`` is given)."""
         episodes = []
+        downloads = []
 
         try:
             # Parse RSS feed
-            feed = feedparser.parse(rss_url)
+            if feed is None:
+                feed = self._parse_feed(rss_url)
 
             if feed.bozo:
                 logger.warning(f"RSS feed may be malformed: {rss_url}")
@@ -106,41 +251,90 @@ class PodcastScraper(BaseScraper):
             logger.info(f"Found {len(feed.entries)} episodes in {feed_title}")
 
             # Process episodes
+            filter_dates = bool(date_from or date_to)
+            skipped = 0
             for entry in feed.entries[:max_episodes]:
                 try:
+                    # Episodes stored on an earlier run are not rebuilt
+                    if entry.get('link') in self.skip_urls:
+                        skipped += 1
+                        continue
+
+                    # Reject out-of-range episodes from feedparser's parsed
+                    # date before building them (summary HTML, audio lookup)
+                    published_parsed = entry.get('published_parsed')
+                    if filter_dates and published_parsed:
+                        if not self._in_date_range(datetime(*published_parsed[:6]), date_from, date_to):
+                            continue
+
                     episode = self._process_episode(
                         entry=entry,
                         podcast_name=feed_title,
-                        feed_description=feed_description,
-                        download_audio=download_audio
+                        feed_description=feed_description
                     )
 
                     if episode:
-                        # Filter by date
-                        if date_from or date_to:
+                        # Dates feedparser couldn't parse are only known now
+                        if filter_dates and not published_parsed:
                             episode_date = episode.get('date_published')
-                            if episode_date:
-                                episode_dt = datetime.fromisoformat(episode_date)
-                                if date_from and episode_dt < date_from:
-                                    continue
-                                if date_to and episode_dt > date_to:
-                                    continue
+                            if episode_date and not self._in_date_range(
+                                datetime.fromisoformat(episode_date), date_from, date_to
+                            ):
+                                continue
 
                         if self.validate_content(episode):
                             episodes.append(episode)
-                            self.stats['items_scraped'] += 1
+                            self._increment_stat('items_scraped')
+                            if download_audio and episode['metadata']['audio_url']:
+                                downloads.append((episode, entry.get('title', 'Untitled Episode')))
                         else:
-                            self.stats['items_filtered'] += 1
+                            self._increment_stat('items_filtered')
 
                 except Exception as e:
                     logger.warning(f"Failed to process episode: {e}")
                     continue
 
+            if skipped:
+                logger.info(f"Skipped {skipped} already scraped episodes of {feed_title}")
+
         except Exception as e:
             logger.error(f"Failed to parse RSS feed {rss_url}: {e}", exc_info=True)
 
+        # Download audio for the kept episodes a few files at a time
+        def download(item: tuple):
+            episode, title = item
+            audio_file = self._download_audio(episode['metadata']['audio_url'], title)
+            if audio_file:
+                episode['metadata']['audio_file'] = audio_file
+                episode['metadata']['audio_downloaded'] = True
+
+        self._map_concurrent(download, downloads, max_workers=PODCAST_SETTINGS['parallel_downloads'])
+
         return episodes
 
+    @staticmethod
+    def _in_date_range(
+        published: datetime,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime]
+    ) -> bool:
+        """Check a publication date against optional bounds."""
+        if date_from and published < date_from:
+            return False
+        if date_to and published > date_to:
+            return False
+        return True
+
+    def _parse_feed(self, rss_url: str) -> feedparser.FeedParserDict:
+        """
+        Download and parse an RSS feed.
+
+        The feed is fetched through the shared session (pooled, rate
+        limited, revalidated against the response cache) rather than by
+        feedparser itself, so an unchanged feed costs a 304.
+        """
+        return _parse_feed_body(rss_url, self.fetch_page(rss_url))
+
     def _process_episode(
         self,
         entry,
@@ -154,26 +348,25 @@ class PodcastScraper(BaseScraper):
             title = entry.get('title', 'Untitled Episode')
             summary = entry.get('summary', entry.get('description', ''))
 
-            # Clean HTML from summary if present
-            from bs4 import BeautifulSoup
-            summary = BeautifulSoup(summary, 'html.parser').get_text(separator='\n', strip=True)
+            # Clean HTML from summary if present; feeds are parsed without
+            # sanitizing, so plain-text summaries may still carry entities
+            if '<' in summary:
+                summary = BeautifulSoup(summary, HTML_PARSER).get_text(separator='\n', strip=True)
+            else:
+                summary = html.unescape(summary).strip()
 
             # Get episode URL
             url = entry.get('link', '')
 
-            # Get audio URL
-            audio_url = None
-            for link in entry.get('links', []):
-                if link.get('type', '').startswith('audio/'):
-                    audio_url = link.get('href')
-                    break
-
-            # If no audio link found, try enclosures
-            if not audio_url and hasattr(entry, 'enclosures') and entry.enclosures:
-                for enclosure in entry.enclosures:
-                    if enclosure.get('type', '').startswith('audio/'):
-                        audio_url = enclosure.get('href')
-                        break
+            # Get audio URL: first audio link, falling back to enclosures
+            audio_url = next(
+                (
+                    link['href']
+                    for link in chain(entry.get('links', []), entry.get('enclosures') or [])
+                    if link.get('href') and (link.get('type') or '').startswith('audio/')
+                ),
+                None
+            )
 
             # Get publication date
             published_date = None
@@ -181,7 +374,7 @@ class PodcastScraper(BaseScraper):
                 published_date = datetime(*entry.published_parsed[:6])
             elif hasattr(entry, 'published'):
                 try:
-                    published_date = date_parser.parse(entry.published)
+                    published_date = _parse_pub_date(entry.published)
                 except:
                     pass
 
@@ -237,26 +430,17 @@ class PodcastScraper(BaseScraper):
 
     def _parse_duration(self, duration_str: str) -> Optional[int]:
         """Parse duration string to seconds."""
-        try:
-            # Handle formats like "1:23:45" or "45:30" or "125"
-            parts = str(duration_str).split(':')
-            if len(parts) == 3:
-                hours, minutes, seconds = parts
-                return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
-            elif len(parts) == 2:
-                minutes, seconds = parts
-                return int(minutes) * 60 + int(seconds)
-            else:
-                return int(duration_str)
-        except:
+        # Handle formats like "1:23:45" or "45:30" or "125"
+        match = DURATION_RE.fullmatch(str(duration_str).strip())
+        if not match:
             return None
 
+        hours, minutes, seconds = match.groups()
+        return int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds)
+
     def _download_audio(self, audio_url: str, title: str) -> Optional[str]:
         """Download podcast audio file."""
         try:
-            import os
-            from config.settings import RAW_DATA_DIR
-
             # Create audio directory
             audio_dir = RAW_DATA_DIR / 'audio' / 'podcasts'
             audio_dir.mkdir(parents=True, exist_ok=True)
@@ -271,13 +455,26 @@ class PodcastScraper(BaseScraper):
             filename = f"{safe_title}.{extension}"
             filepath = audio_dir / filename
 
+            # Files only appear once complete, so an existing one is reusable
+            if filepath.exists():
+                logger.debug(f"Audio already downloaded: {filepath}")
+                return str(filepath)
+
             # Download file
             logger.info(f"Downloading audio: {title}")
-            response = self.fetch_url(audio_url, stream=True)
-
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # A unique part file per download: concurrent downloads of
+            # same-titled episodes must not write into each other
+            part = tempfile.NamedTemporaryFile(dir=audio_dir, suffix='.part', delete=False)
+            part_path = Path(part.name)
+            try:
+                # Closing the streamed response hands its connection back to the
+                # shared session's pool for the next episode on the same host
+                with part, self.fetch_url(audio_url, stream=True) as response:
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, part, AUDIO_CHUNK_SIZE)
+                os.replace(part_path, filepath)
+            finally:
+                part_path.unlink(missing_ok=True)
 
             logger.info(f"Downloaded audio to {filepath}")
             return str(filepath)
@@ -289,7 +486,7 @@ class PodcastScraper(BaseScraper):
     def get_episode_by_url(self, rss_url: str, episode_title: str) -> Optional[Dict[str, Any]]:
         """Get a specific episode by RSS URL and title."""
         try:
-            feed = feedparser.parse(rss_url)
+            feed = self._parse_feed(rss_url)
 
             for entry in feed.entries:
                 if entry.get('title') == episode_title:
@@ -1,13 +1,18 @@
 """
 Twitter/X scraper for extracting tweets and threads.
 """
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import tweepy
 from loguru import logger
 
 from scrapers.base_scraper import BaseScraper
+from utils.json_cache import JsonCache
 from config.settings import (
+    DATA_DIR,
     TWITTER_API_KEY,
     TWITTER_API_SECRET,
     TWITTER_ACCESS_TOKEN,
@@ -16,6 +21,43 @@ from config.settings import (
     TWITTER_SETTINGS
 )
 
+# Public engagement counters kept per tweet and summed per thread
+METRIC_KEYS = ('retweet_count', 'reply_count', 'like_count', 'quote_count')
+
+# Handle -> user ID lookups, kept for a month
+USER_ID_CACHE = JsonCache(DATA_DIR / 'twitter_user_ids.json', ttl=30 * 24 * 60 * 60)
+
+
+@lru_cache(maxsize=1)
+def shared_twitter_client() -> Optional[tweepy.Client]:
+    """
+    Get the process-wide Twitter API v2 client.
+
+    Scrapers for different authors run concurrently; sharing one client
+    shares its keep-alive connections to the API, so each pagination call
+    after the first skips the TLS handshake.
+
+    Returns:
+        Client, or None if no credentials are configured
+    """
+    if not TWITTER_BEARER_TOKEN:
+        logger.warning("Twitter Bearer Token not found. Twitter scraping will be limited.")
+        return None
+
+    try:
+        return tweepy.Client(
+            bearer_token=TWITTER_BEARER_TOKEN,
+            consumer_key=TWITTER_API_KEY,
+            consumer_secret=TWITTER_API_SECRET,
+            access_token=TWITTER_ACCESS_TOKEN,
+            access_token_secret=TWITTER_ACCESS_TOKEN_SECRET,
+            wait_on_rate_limit=True
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to initialize Twitter client: {e}")
+        return None
+
 
 class TwitterScraper(BaseScraper):
     """Scraper for Twitter/X posts."""
@@ -30,45 +72,38 @@ class TwitterScraper(BaseScraper):
 
         # Remove @ if present
         self.twitter_handle = self.twitter_handle.lstrip('@')
+        self._tweet_url_prefix = f"https://twitter.com/{self.twitter_handle}/status/"
 
         # Initialize Twitter API client
         self.client = self._init_twitter_client()
         self.user_id = None
 
     def _init_twitter_client(self) -> Optional[tweepy.Client]:
-        """Initialize Twitter API v2 client."""
-        if not TWITTER_BEARER_TOKEN:
-            logger.warning("Twitter Bearer Token not found. Twitter scraping will be limited.")
-            return None
-
-        try:
-            client = tweepy.Client(
-                bearer_token=TWITTER_BEARER_TOKEN,
-                consumer_key=TWITTER_API_KEY,
-                consumer_secret=TWITTER_API_SECRET,
-                access_token=TWITTER_ACCESS_TOKEN,
-                access_token_secret=TWITTER_ACCESS_TOKEN_SECRET,
-                wait_on_rate_limit=True
-            )
+        """Get the Twitter API v2 client shared by all Twitter scrapers."""
+        client = shared_twitter_client()
+        if client:
             logger.info(f"Initialized Twitter API client for @{self.twitter_handle}")
-            return client
-
-        except Exception as e:
-            logger.error(f"Failed to initialize Twitter client: {e}")
-            return None
+        return client
 
     def _get_user_id(self) -> Optional[str]:
         """Get Twitter user ID from handle."""
         if self.user_id:
             return self.user_id
 
+        # Handles rarely change owner, so lookups are reused across runs
+        cache_key = self.twitter_handle.lower()
+        self.user_id = USER_ID_CACHE.get(cache_key)
+        if self.user_id:
+            return self.user_id
+
         if not self.client:
             return None
 
         try:
             user = self.client.get_user(username=self.twitter_handle)
             if user and user.data:
-                self.user_id = user.data.id
+                self.user_id = str(user.data.id)
+                USER_ID_CACHE.set(cache_key, self.user_id)
                 logger.info(f"Found user ID for @{self.twitter_handle}: {self.user_id}")
                 return self.user_id
 
@@ -131,9 +166,9 @@ class TwitterScraper(BaseScraper):
                 content_obj = self._process_tweet(tweet)
                 if content_obj and self.validate_content(content_obj):
                     all_content.append(content_obj)
-                    self.stats['items_scraped'] += 1
+                    self._increment_stat('items_scraped')
                 else:
-                    self.stats['items_filtered'] += 1
+                    self._increment_stat('items_filtered')
 
             # Detect and reconstruct threads
             threads = self._reconstruct_threads(all_content)
@@ -200,19 +235,18 @@ class TwitterScraper(BaseScraper):
             # Get metrics
             metrics = {}
             if hasattr(tweet, 'public_metrics'):
-                metrics = {
-                    'retweet_count': tweet.public_metrics.get('retweet_count', 0),
-                    'reply_count': tweet.public_metrics.get('reply_count', 0),
-                    'like_count': tweet.public_metrics.get('like_count', 0),
-                    'quote_count': tweet.public_metrics.get('quote_count', 0)
-                }
+                metrics = {key: tweet.public_metrics.get(key, 0) for key in METRIC_KEYS}
 
             # Check if part of thread
-            referenced_tweets = getattr(tweet, 'referenced_tweets', [])
-            is_reply = any(ref.type == 'replied_to' for ref in referenced_tweets) if referenced_tweets else False
+            referenced_tweets = getattr(tweet, 'referenced_tweets', None) or []
+            is_reply = False
+            for ref in referenced_tweets:
+                if ref.type == 'replied_to':
+                    is_reply = True
+                    break
 
             # Build URL
-            url = f"https://twitter.com/{self.twitter_handle}/status/{tweet_id}"
+            url = f"{self._tweet_url_prefix}{tweet_id}"
 
             # Metadata
             metadata = {
@@ -224,7 +258,7 @@ class TwitterScraper(BaseScraper):
                 'referenced_tweets': [
                     {'id': str(ref.id), 'type': ref.type}
                     for ref in referenced_tweets
-                ] if referenced_tweets else []
+                ]
             }
 
             # Create content object
@@ -246,21 +280,17 @@ class TwitterScraper(BaseScraper):
         """Reconstruct tweet threads from individual tweets."""
         threads = []
 
-        # Group tweets by conversation_id
-        conversations = {}
-        for tweet in tweets:
+        # Group tweets by conversation_id; sorting once by date up front
+        # leaves every group in date order
+        conversations = defaultdict(list)
+        for tweet in sorted(tweets, key=itemgetter('date_published')):
             conv_id = tweet['metadata'].get('conversation_id')
             if conv_id:
-                if conv_id not in conversations:
-                    conversations[conv_id] = []
                 conversations[conv_id].append(tweet)
 
         # Reconstruct threads (conversations with multiple tweets)
         for conv_id, conv_tweets in conversations.items():
             if len(conv_tweets) > 1:
-                # Sort by date
-                conv_tweets.sort(key=lambda x: x['date_published'])
-
                 # Combine into thread
                 thread_text = '\n\n'.join([t['content'] for t in conv_tweets])
                 first_tweet = conv_tweets[0]
@@ -292,19 +322,13 @@ class TwitterScraper(BaseScraper):
 
     def _combine_metrics(self, tweets: List[Dict[str, Any]]) -> Dict[str, int]:
         """Combine metrics from multiple tweets in a thread."""
-        combined = {
-            'retweet_count': 0,
-            'reply_count': 0,
-            'like_count': 0,
-            'quote_count': 0
-        }
-
-        for tweet in tweets:
-            metrics = tweet['metadata'].get('metrics', {})
-            for key in combined:
-                combined[key] += metrics.get(key, 0)
-
-        return combined
+        # One row of counts per tweet, summed column-wise
+        rows = (
+            [metrics.get(key, 0) for key in METRIC_KEYS]
+            for metrics in (tweet['metadata'].get('metrics', {}) for tweet in tweets)
+        )
+        totals = map(sum, zip(*rows)) if tweets else (0,) * len(METRIC_KEYS)
+        return dict(zip(METRIC_KEYS, totals))
 
     def get_tweet_by_id(self, tweet_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific tweet by ID."""
@@ -1,9 +1,13 @@
 """
 YouTube scraper for extracting video transcripts and metadata.
 """
+import re
+import threading
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import httplib2
 from loguru import logger
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
@@ -11,7 +15,29 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from scrapers.base_scraper import BaseScraper
-from config.settings import YOUTUBE_API_KEY, YOUTUBE_SETTINGS
+from utils.memory_cache import MemoryCache
+from config.settings import REQUEST_TIMEOUT, YOUTUBE_API_KEY, YOUTUBE_SETTINGS
+
+# Most IDs videos.list accepts in one call
+VIDEOS_PER_REQUEST = 50
+
+# Parsed videos.list results, shared by all YouTube scrapers in the process;
+# entries expire after an hour so view/like counts don't go stale
+VIDEO_METADATA_CACHE = MemoryCache(2048, ttl=60 * 60)
+
+# contentDetails.duration, e.g. PT1H2M10S
+DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_duration(duration: str) -> int:
+    """Parse an ISO 8601 video duration to seconds (0 if unrecognized)."""
+    match = DURATION_RE.match(duration)
+    if not match:
+        return 0
+
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds or 0)
 
 
 class YouTubeScraper(BaseScraper):
@@ -27,6 +53,7 @@ class YouTubeScraper(BaseScraper):
 
         # Initialize YouTube API client
         self.youtube = self._init_youtube_client()
+        self._local = threading.local()
 
     def _init_youtube_client(self):
         """Initialize YouTube Data API v3 client."""
@@ -43,6 +70,18 @@ class YouTubeScraper(BaseScraper):
             logger.error(f"Failed to initialize YouTube client: {e}")
             return None
 
+    def _api_http(self) -> httplib2.Http:
+        """
+        Get this thread's HTTP connection for API calls.
+
+        The API client's default ``httplib2.Http`` is not thread-safe, so
+        requests made from worker threads each run on their own.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = httplib2.Http(timeout=REQUEST_TIMEOUT)
+        return http
+
     def scrape(
         self,
         max_videos: int = 50,
@@ -116,22 +155,35 @@ class YouTubeScraper(BaseScraper):
 
             logger.info(f"Found {len(video_ids)} videos from {channel_name}")
 
-            # Process each video
-            for video_id in video_ids:
+            # Metadata for the whole channel in a few batched calls
+            video_metadata = self._get_video_metadata_batch(video_ids)
+
+            # Transcripts are two round trips per video, mostly spent
+            # waiting on the network, so fetch several at once
+            video_ids = [video_id for video_id in video_ids if video_id in video_metadata]
+            transcripts = self._map_concurrent(
+                self._get_transcript,
+                video_ids,
+                max_workers=YOUTUBE_SETTINGS['max_concurrent_requests']
+            )
+
+            for video_id, transcript in zip(video_ids, transcripts):
                 try:
-                    video_content = self._scrape_video(video_id, channel_name)
+                    video_content = self._build_video(
+                        video_id, channel_name, video_metadata[video_id], transcript
+                    )
 
                     if video_content:
                         # Filter shorts if needed
                         if not include_shorts and video_content['metadata'].get('is_short'):
-                            self.stats['items_filtered'] += 1
+                            self._increment_stat('items_filtered')
                             continue
 
                         if self.validate_content(video_content):
                             videos.append(video_content)
-                            self.stats['items_scraped'] += 1
+                            self._increment_stat('items_scraped')
                         else:
-                            self.stats['items_filtered'] += 1
+                            self._increment_stat('items_filtered')
 
                 except Exception as e:
                     logger.warning(f"Failed to scrape video {video_id}: {e}")
@@ -200,6 +252,21 @@ class YouTubeScraper(BaseScraper):
             # Get transcript
             transcript = self._get_transcript(video_id)
 
+        except Exception as e:
+            logger.error(f"Failed to scrape video {video_id}: {e}", exc_info=True)
+            return None
+
+        return self._build_video(video_id, channel_name, video_metadata, transcript)
+
+    def _build_video(
+        self,
+        video_id: str,
+        channel_name: str,
+        video_metadata: Dict[str, Any],
+        transcript: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Build the content object for a video from its metadata and transcript."""
+        try:
             # Build content
             title = video_metadata['title']
             description = video_metadata['description']
@@ -251,39 +318,77 @@ class YouTubeScraper(BaseScraper):
 
     def _get_video_metadata(self, video_id: str) -> Optional[Dict[str, Any]]:
         """Get video metadata from YouTube API."""
-        try:
-            response = self.youtube.videos().list(
-                part='snippet,contentDetails,statistics',
-                id=video_id
-            ).execute()
+        return self._get_video_metadata_batch([video_id]).get(video_id)
 
-            if not response.get('items'):
-                return None
+    def _get_video_metadata_batch(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metadata for several videos from YouTube API.
 
-            item = response['items'][0]
-            snippet = item['snippet']
-            content_details = item['contentDetails']
-            statistics = item['statistics']
-
-            # Parse duration
-            duration = content_details.get('duration', 'PT0S')
-            duration_seconds = self._parse_duration(duration)
-
-            return {
-                'title': snippet['title'],
-                'description': snippet.get('description', ''),
-                'published_at': datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')),
-                'duration_seconds': duration_seconds,
-                'view_count': int(statistics.get('viewCount', 0)),
-                'like_count': int(statistics.get('likeCount', 0)),
-                'comment_count': int(statistics.get('commentCount', 0)),
-                'tags': snippet.get('tags', []),
-                'category': snippet.get('categoryId')
-            }
+        ``videos.list`` takes up to 50 comma-separated IDs and costs one
+        quota unit per call regardless, so IDs are requested in batches.
 
-        except HttpError as e:
-            logger.error(f"Failed to get metadata for video {video_id}: {e}")
-            return None
+        Args:
+            video_ids: Video IDs
+
+        Returns:
+            Metadata by video ID (videos that are missing or failed are left out)
+        """
+        metadata = {}
+
+        # Videos looked up within the last hour don't cost another call
+        missing = []
+        for video_id in video_ids:
+            cached = VIDEO_METADATA_CACHE.get(video_id)
+            if cached is not None:
+                metadata[video_id] = cached
+            else:
+                missing.append(video_id)
+
+        for start in range(0, len(missing), VIDEOS_PER_REQUEST):
+            batch = missing[start:start + VIDEOS_PER_REQUEST]
+            try:
+                response = self.youtube.videos().list(
+                    part='snippet,contentDetails,statistics',
+                    id=','.join(batch)
+                ).execute(http=self._api_http())
+
+            except HttpError as e:
+                logger.error(f"Failed to get metadata for videos {batch}: {e}")
+                continue
+
+            for item in response.get('items', []):
+                # One malformed item only costs that video, not the batch
+                try:
+                    parsed = self._parse_video_item(item)
+                except Exception as e:
+                    logger.warning(f"Skipping video {item.get('id')} with unexpected metadata: {e}")
+                    continue
+                metadata[item['id']] = parsed
+                VIDEO_METADATA_CACHE.set(item['id'], parsed)
+
+        return metadata
+
+    def _parse_video_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the fields we keep from a ``videos.list`` item."""
+        snippet = item['snippet']
+        content_details = item['contentDetails']
+        statistics = item['statistics']
+
+        # Parse duration
+        duration = content_details.get('duration', 'PT0S')
+        duration_seconds = self._parse_duration(duration)
+
+        return {
+            'title': snippet['title'],
+            'description': snippet.get('description', ''),
+            'published_at': datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')),
+            'duration_seconds': duration_seconds,
+            'view_count': int(statistics.get('viewCount', 0)),
+            'like_count': int(statistics.get('likeCount', 0)),
+            'comment_count': int(statistics.get('commentCount', 0)),
+            'tags': snippet.get('tags', []),
+            'category': snippet.get('categoryId')
+        }
 
     def _get_transcript(self, video_id: str) -> Optional[str]:
         """Get video transcript."""
@@ -318,18 +423,7 @@ class YouTubeScraper(BaseScraper):
 
     def _parse_duration(self, duration: str) -> int:
         """Parse ISO 8601 duration to seconds."""
-        import re
-
-        # Parse format like PT1H2M10S
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration)
-        if not match:
-            return 0
-
-        hours = int(match.group(1) or 0)
-        minutes = int(match.group(2) or 0)
-        seconds = int(match.group(3) or 0)
-
-        return hours * 3600 + minutes * 60 + seconds
+        return _parse_iso_duration(duration)
 
     def _is_short_video(self, metadata: Dict[str, Any]) -> bool:
         """Determine if video is a YouTube Short (< 60 seconds)."""
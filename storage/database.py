@@ -3,18 +3,72 @@ Database layer for storing scraped content using SQLAlchemy.
 """
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Set
 from contextlib import contextmanager
+from functools import lru_cache
 
 from sqlalchemy import (
-    create_engine, Column, String, Text, Integer,
-    DateTime, Float, Boolean, JSON, Index
+    create_engine, select, insert, update, func, case, Column, String, Text,
+    Integer, DateTime, Float, Boolean, JSON, Index
 )
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from loguru import logger
 
-from config.settings import DATABASE_URL
+from config.settings import DATABASE_URL, MAX_WORKERS
+from utils.memory_cache import MemoryCache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE, for bulk upserts
+UPSERT_INSERTS = {
+    'sqlite': sqlite_insert,
+    'postgresql': postgresql_insert,
+}
+
+# Rows kept in the in-process cache behind get_content_by_id
+CONTENT_CACHE_SIZE = 2048
+
+# IDs bound per statement in bulk updates
+ID_CHUNK_SIZE = 500
+
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 500
+
+
+def _dump_row(row: Dict[str, Any]) -> bytes:
+    """
+    Serialize a single exported row to JSON bytes.
+
+    Rows are indented as elements of an ``indent=2`` array, matching the
+    layout of ``json.dump(rows, f, indent=2)``.
+    """
+    if orjson is not None:
+        data = orjson.dumps(row, default=str, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(row, default=str, indent=2).encode('utf-8')
+    # JSON strings never contain raw newlines, so this only nests the layout
+    return b'  ' + data.replace(b'\n', b'\n  ')
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize a JSON column (content metadata) for the database."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value, default=str)
+
+
+def _json_deserializer(value: str) -> Any:
+    """Parse a JSON column read back from the database."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
 
 Base = declarative_base()
 
@@ -92,6 +146,34 @@ class Content(Base):
         }
 
 
+@lru_cache(maxsize=None)
+def _get_engine(database_url: str):
+    """
+    Get the shared engine (and connection pool) for a database URL.
+
+    Every ContentDatabase for the same URL reuses one engine, so concurrent
+    scrapers and repeated CLI calls share pooled connections.
+    """
+    if database_url.startswith('sqlite'):
+        # SQLite's pool is per-file and doesn't take sizing arguments
+        return create_engine(
+            database_url,
+            echo=False,
+            json_serializer=_json_serializer,
+            json_deserializer=_json_deserializer
+        )
+
+    return create_engine(
+        database_url,
+        echo=False,
+        json_serializer=_json_serializer,
+        json_deserializer=_json_deserializer,
+        pool_size=MAX_WORKERS,
+        max_overflow=2 * MAX_WORKERS,
+        pool_pre_ping=True
+    )
+
+
 class ContentDatabase:
     """Database manager for content storage."""
 
@@ -103,9 +185,12 @@ class ContentDatabase:
             database_url: Database connection URL
         """
         self.database_url = database_url or DATABASE_URL
-        self.engine = create_engine(self.database_url, echo=False)
+        self.engine = _get_engine(self.database_url)
         self.SessionLocal = sessionmaker(bind=self.engine)
 
+        # Recently read rows; every write through this object drops its IDs
+        self._content_cache = MemoryCache(CONTENT_CACHE_SIZE)
+
         # Create tables
         self.create_tables()
 
@@ -145,6 +230,8 @@ class ContentDatabase:
         Returns:
             True if successful
         """
+        self._content_cache.pop(content_obj['id'])
+
         try:
             with self.get_session() as session:
                 # Check if content already exists
@@ -187,27 +274,150 @@ class ContentDatabase:
         """
         Save multiple content objects.
 
+        The whole batch is written in a single transaction. On SQLite and
+        PostgreSQL it is one ``INSERT ... ON CONFLICT DO UPDATE``
+        executemany; elsewhere existing IDs are looked up with one query,
+        then new rows are inserted and existing rows updated with one
+        executemany each. If the batch fails, items are retried one at a
+        time so a single bad row doesn't lose the rest.
+
         Args:
             contents: List of content dictionaries
 
         Returns:
-            Number of successfully saved items
+            Number of distinct content IDs saved
         """
-        saved = 0
+        if not contents:
+            return 0
+
+        # Later duplicates of the same ID win, as with sequential saves
+        rows = {}
+        latest = {}
+        for content_obj in contents:
+            row = self._to_row(content_obj)
+            rows[row['id']] = row
+            latest[row['id']] = content_obj
+            self._content_cache.pop(row['id'])
+
+        try:
+            with self.get_session() as session:
+                if not self._upsert(session, list(rows.values())):
+                    existing_ids = set(session.scalars(
+                        select(Content.id).where(Content.id.in_(list(rows)))
+                    ))
 
-        for content in contents:
-            if self.save_content(content):
-                saved += 1
+                    new_rows = [row for content_id, row in rows.items() if content_id not in existing_ids]
+                    updated_rows = [row for content_id, row in rows.items() if content_id in existing_ids]
 
-        logger.info(f"Saved {saved}/{len(contents)} content items")
+                    if new_rows:
+                        session.execute(insert(Content), new_rows)
+                    if updated_rows:
+                        session.execute(update(Content), updated_rows)
+
+            saved = len(rows)
+
+        except Exception as e:
+            logger.error(f"Bulk save failed, falling back to per-item saves: {e}")
+            saved = 0
+            for content in latest.values():
+                if self.save_content(content):
+                    saved += 1
+
+        logger.info(f"Saved {saved}/{len(rows)} distinct content items ({len(contents)} submitted)")
         return saved
 
+    def _upsert(self, session: Session, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Insert or update rows with the dialect's ``ON CONFLICT`` upsert.
+
+        Rows are grouped by the columns they set, so a conflicting row only
+        overwrites the columns it carries, as an ORM update would.
+
+        Returns:
+            False if the database has no supported upsert (nothing written)
+        """
+        dialect_insert = UPSERT_INSERTS.get(self.engine.dialect.name)
+        if dialect_insert is None:
+            return False
+
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+
+        now = datetime.now()
+        for columns, group in groups.items():
+            stmt = dialect_insert(Content)
+            updates = {col: stmt.excluded[col] for col in columns if col != 'id'}
+            updates['updated_at'] = now
+            session.execute(
+                stmt.on_conflict_do_update(index_elements=[Content.id], set_=updates),
+                group
+            )
+
+        return True
+
+    @staticmethod
+    def _to_row(content_obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a content dictionary into column values for bulk writes."""
+        row = {
+            key: value for key, value in content_obj.items()
+            if key in Content.__table__.columns
+        }
+
+        # Convert date strings to datetime
+        for key in ('date_published', 'date_scraped'):
+            if isinstance(row.get(key), str):
+                row[key] = datetime.fromisoformat(row[key])
+
+        # Extract word count from metadata if not present
+        if 'word_count' not in row and 'metadata' in row:
+            row['word_count'] = (row['metadata'] or {}).get('word_count', 0)
+
+        return row
+
+    def known_urls(self, author: Optional[str] = None) -> Set[str]:
+        """
+        Get the set of content URLs already stored.
+
+        Args:
+            author: Only return URLs for this author
+
+        Returns:
+            Set of stored URLs
+        """
+        try:
+            with self.get_session() as session:
+                stmt = select(Content.url).distinct()
+
+                if author:
+                    stmt = stmt.where(Content.author == author)
+
+                return set(session.scalars(stmt))
+
+        except Exception as e:
+            logger.error(f"Failed to get known URLs: {e}")
+            return set()
+
     def get_content_by_id(self, content_id: str) -> Optional[Dict[str, Any]]:
-        """Get content by ID."""
+        """
+        Get content by ID.
+
+        Rows are cached in memory after the first read, so repeated lookups
+        skip the database; each call returns its own copy of the dict.
+        """
+        cached = self._content_cache.get(content_id)
+        if cached is not None:
+            return dict(cached)
+
         try:
             with self.get_session() as session:
                 content = session.query(Content).filter_by(id=content_id).first()
-                return content.to_dict() if content else None
+                if content is None:
+                    return None
+
+                row = content.to_dict()
+                self._content_cache.set(content_id, row)
+                return dict(row)
         except Exception as e:
             logger.error(f"Failed to get content {content_id}: {e}")
             return None
@@ -239,9 +449,7 @@ class ContentDatabase:
     def get_unprocessed_content(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get content that hasn't been processed yet."""
         try:
-            with self.get_session() as session:
-                contents = session.query(Content).filter_by(processed=False).limit(limit).all()
-                return [c.to_dict() for c in contents]
+            return list(self.iter_unprocessed_content(limit))
         except Exception as e:
             logger.error(f"Failed to get unprocessed content: {e}")
             return []
@@ -249,61 +457,130 @@ class ContentDatabase:
     def get_unembedded_content(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get content that hasn't been embedded yet."""
         try:
-            with self.get_session() as session:
-                contents = session.query(Content).filter_by(
-                    processed=True,
-                    embedded=False
-                ).limit(limit).all()
-                return [c.to_dict() for c in contents]
+            return list(self.iter_unembedded_content(limit))
         except Exception as e:
             logger.error(f"Failed to get unembedded content: {e}")
             return []
 
+    def iter_unprocessed_content(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream content that hasn't been processed yet.
+
+        Args:
+            limit: Maximum number of items (None for all)
+
+        Yields:
+            Content dictionaries, fetched from the database in batches
+        """
+        yield from self._iter_content(
+            select(Content).filter_by(processed=False), limit
+        )
+
+    def iter_unembedded_content(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream content that has been processed but not embedded yet.
+
+        Args:
+            limit: Maximum number of items (None for all)
+
+        Yields:
+            Content dictionaries, fetched from the database in batches
+        """
+        yield from self._iter_content(
+            select(Content).filter_by(processed=True, embedded=False), limit
+        )
+
+    def _iter_content(self, stmt, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """
+        Run a content query on a server-side cursor and yield rows as dicts.
+
+        The session stays open until the generator is exhausted or closed,
+        so consumers can start on the first rows before the rest arrive.
+        """
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        stmt = stmt.execution_options(stream_results=True)
+
+        with self.get_session() as session:
+            for content in session.scalars(stmt).yield_per(STREAM_BATCH_SIZE):
+                yield content.to_dict()
+
     def mark_processed(self, content_id: str) -> bool:
         """Mark content as processed."""
-        try:
-            with self.get_session() as session:
-                content = session.query(Content).filter_by(id=content_id).first()
-                if content:
-                    content.processed = True
-                    return True
-                return False
-        except Exception as e:
-            logger.error(f"Failed to mark content as processed: {e}")
-            return False
+        return self.mark_processed_batch([content_id]) > 0
 
     def mark_embedded(self, content_id: str) -> bool:
         """Mark content as embedded."""
+        return self.mark_embedded_batch([content_id]) > 0
+
+    def mark_processed_batch(self, content_ids: List[str]) -> int:
+        """
+        Mark several content items as processed.
+
+        Args:
+            content_ids: Content IDs
+
+        Returns:
+            Number of rows updated
+        """
+        return self._set_flag(content_ids, 'processed')
+
+    def mark_embedded_batch(self, content_ids: List[str]) -> int:
+        """
+        Mark several content items as embedded.
+
+        Args:
+            content_ids: Content IDs
+
+        Returns:
+            Number of rows updated
+        """
+        return self._set_flag(content_ids, 'embedded')
+
+    def _set_flag(self, content_ids: List[str], flag: str) -> int:
+        """Set a boolean status column to True with one UPDATE per chunk of IDs."""
+        content_ids = list(dict.fromkeys(content_ids))
+        for content_id in content_ids:
+            self._content_cache.pop(content_id)
+
         try:
+            updated = 0
             with self.get_session() as session:
-                content = session.query(Content).filter_by(id=content_id).first()
-                if content:
-                    content.embedded = True
-                    return True
-                return False
+                # Stay well below bound-parameter limits
+                for i in range(0, len(content_ids), ID_CHUNK_SIZE):
+                    result = session.execute(
+                        update(Content)
+                        .where(Content.id.in_(content_ids[i:i + ID_CHUNK_SIZE]))
+                        .values({flag: True, 'updated_at': datetime.now()})
+                    )
+                    updated += result.rowcount
+            return updated
+
         except Exception as e:
-            logger.error(f"Failed to mark content as embedded: {e}")
-            return False
+            logger.error(f"Failed to mark content as {flag}: {e}")
+            return 0
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
         try:
             with self.get_session() as session:
-                total = session.query(Content).count()
-                processed = session.query(Content).filter_by(processed=True).count()
-                embedded = session.query(Content).filter_by(embedded=True).count()
-
-                by_author = {}
-                authors = session.query(Content.author).distinct().all()
-                for (author,) in authors:
-                    count = session.query(Content).filter_by(author=author).count()
-                    by_author[author] = count
-
-                by_platform = {}
-                platforms = session.query(Content.platform).distinct().all()
-                for (platform,) in platforms:
-                    count = session.query(Content).filter_by(platform=platform).count()
-                    by_platform[platform] = count
+                # All three totals in one scan
+                total, processed, embedded = session.execute(
+                    select(
+                        func.count(Content.id),
+                        func.count(case((Content.processed, 1))),
+                        func.count(case((Content.embedded, 1)))
+                    )
+                ).one()
+
+                # One GROUP BY per breakdown instead of a COUNT per value
+                by_author = dict(session.execute(
+                    select(Content.author, func.count(Content.id)).group_by(Content.author)
+                ).all())
+
+                by_platform = dict(session.execute(
+                    select(Content.platform, func.count(Content.id)).group_by(Content.platform)
+                ).all())
 
                 return {
                     'total_content': total,
@@ -319,6 +596,8 @@ class ContentDatabase:
 
     def delete_content(self, content_id: str) -> bool:
         """Delete content by ID."""
+        self._content_cache.pop(content_id)
+
         try:
             with self.get_session() as session:
                 content = session.query(Content).filter_by(id=content_id).first()
@@ -332,20 +611,29 @@ class ContentDatabase:
             return False
 
     def export_to_json(self, filepath: str, author: Optional[str] = None):
-        """Export content to JSON file."""
+        """
+        Export content to JSON file.
+
+        Rows are streamed from the database and written one at a time, so
+        memory use does not grow with the size of the table.
+        """
         try:
             with self.get_session() as session:
-                query = session.query(Content)
+                stmt = select(Content).execution_options(stream_results=True)
 
                 if author:
-                    query = query.filter_by(author=author)
-
-                contents = [c.to_dict() for c in query.all()]
-
-                with open(filepath, 'w') as f:
-                    json.dump(contents, f, indent=2, default=str)
-
-                logger.info(f"Exported {len(contents)} items to {filepath}")
+                    stmt = stmt.filter_by(author=author)
+
+                count = 0
+                with open(filepath, 'wb') as f:
+                    f.write(b'[')
+                    for content in session.scalars(stmt).yield_per(STREAM_BATCH_SIZE):
+                        f.write(b',\n' if count else b'\n')
+                        f.write(_dump_row(content.to_dict()))
+                        count += 1
+                    f.write(b'\n]' if count else b']')
+
+                logger.info(f"Exported {count} items to {filepath}")
 
         except Exception as e:
             logger.error(f"Failed to export to JSON: {e}")
@@ -0,0 +1,92 @@
+"""
+Small persistent key/value cache stored as a JSON file.
+"""
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+class JsonCache:
+    """
+    Thread-safe JSON file cache with per-entry expiry.
+
+    Entries are kept in memory and the whole file is rewritten atomically
+    (temp file + ``os.replace``) on every update, so concurrent readers never
+    see a partially written file. Intended for small caches such as
+    robots.txt bodies or feed validators, not bulk data.
+    """
+
+    def __init__(self, path: Path, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            path: JSON file backing the cache
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the backing file on first use (caller holds the lock)."""
+        if self._entries is None:
+            try:
+                with open(self.path, 'r') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable cache file {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        """Write all entries atomically (caller holds the lock)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self.lock:
+            entry = self._load().get(key)
+
+        if entry is None:
+            return None
+
+        if self.ttl is not None and time.time() - entry['stored_at'] > self.ttl:
+            return None
+
+        return entry['value']
+
+    def set(self, key: str, value: Any):
+        """
+        Store a value and persist the cache.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        with self.lock:
+            self._load()[key] = {'value': value, 'stored_at': time.time()}
+            try:
+                self._save()
+            except OSError as e:
+                logger.warning(f"Could not write cache file {self.path}: {e}")
@@ -0,0 +1,75 @@
+"""
+Small in-process LRU cache for repeat lookups.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class MemoryCache:
+    """
+    Thread-safe least-recently-used cache held in memory.
+
+    Meant to sit in front of a slower lookup (a database query, an API
+    call) whose results can be dropped at any time. Callers own
+    invalidation: anything that changes a cached value must ``pop`` it,
+    unless the values are only ever allowed to be ``ttl`` seconds stale.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Number of entries kept before the oldest is evicted
+            ttl: Seconds an entry stays valid after it is set (None = no expiry)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value, marking it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing
+        """
+        with self.lock:
+            if key not in self._entries:
+                return None
+            value, stored_at = self._entries[key]
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self.lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Drop a cached value, if present."""
+        with self.lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all cached values."""
+        with self.lock:
+            self._entries.clear()
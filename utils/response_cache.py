@@ -0,0 +1,141 @@
+"""
+Persistent on-disk cache of fetched pages for conditional re-requests.
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+class ResponseCache:
+    """
+    SQLite store of page bodies keyed by URL, with their HTTP validators.
+
+    Only responses carrying an ``ETag`` or ``Last-Modified`` header are
+    worth storing: on the next run the scraper sends them back as
+    ``If-None-Match`` / ``If-Modified-Since`` and, on a 304, reuses the
+    stored body instead of downloading the page again. The database is
+    opened on first use, so creating the cache costs nothing. With a
+    ``ttl``, older entries are no longer revalidated and are pruned when the
+    database is opened, so the file doesn't grow without bound.
+    """
+
+    def __init__(self, path: Path, ttl: Optional[float] = None):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite file backing the cache
+            ttl: Seconds an entry stays valid after it is stored (None for no expiry)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+                'body BLOB NOT NULL, stored_at REAL NOT NULL)'
+            )
+            if self.ttl is not None:
+                pruned = self._conn.execute(
+                    'DELETE FROM responses WHERE stored_at < ?', (self._cutoff(),)
+                ).rowcount
+                if pruned:
+                    logger.debug(f"Pruned {pruned} expired responses")
+            self._conn.commit()
+            logger.debug(f"Opened response cache: {self.path}")
+        return self._conn
+
+    def _cutoff(self) -> float:
+        """Oldest ``stored_at`` still within the TTL."""
+        return time.time() - self.ttl if self.ttl is not None else float('-inf')
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored response for a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Dict with ``etag``, ``last_modified`` and ``body``, or None
+        """
+        try:
+            with self.lock:
+                row = self._connect().execute(
+                    'SELECT etag, last_modified, body FROM responses WHERE url = ?',
+                    (url,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed for {url}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        etag, last_modified, body = row
+        return {'etag': etag, 'last_modified': last_modified, 'body': body}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build ``If-None-Match`` / ``If-Modified-Since`` headers for a stored entry.
+
+        Only the validators are read, not the body; expired entries get no
+        headers, so the page is downloaded and stored afresh.
+        """
+        try:
+            with self.lock:
+                row = self._connect().execute(
+                    'SELECT etag, last_modified FROM responses '
+                    'WHERE url = ? AND stored_at >= ?',
+                    (url, self._cutoff())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed for {url}: {e}")
+            return {}
+
+        if row is None:
+            return {}
+
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """
+        Store a response if it carries a validator.
+
+        Args:
+            url: Page URL
+            etag: ``ETag`` response header
+            last_modified: ``Last-Modified`` response header
+            body: Response body
+        """
+        if not etag and not last_modified:
+            return
+
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses '
+                    '(url, etag, last_modified, body, stored_at) VALUES (?, ?, ?, ?, ?)',
+                    (url, etag, last_modified, body, time.time())
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store response for {url}: {e}")
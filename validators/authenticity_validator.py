@@ -7,6 +7,17 @@ from loguru import logger
 
 from config.settings import load_authors_config, MIN_AUTHENTICITY_SCORE
 
+# Lookups used for authors missing from the configuration
+_EMPTY_RULES = {
+    'domains': frozenset(),
+    'domain_suffixes': (),
+    'youtube_channels': frozenset(),
+    'blog_names': frozenset(),
+    'blog_domains': frozenset(),
+    'podcasts': frozenset(),
+    'books': frozenset(),
+}
+
 
 class AuthenticityValidator:
     """Validator to check content authenticity."""
@@ -15,13 +26,15 @@ class AuthenticityValidator:
         """Initialize authenticity validator."""
         self.authors_config = load_authors_config()
         self.official_domains = self._build_domain_whitelist()
+        self.author_rules = self._build_author_rules()
 
     def _build_domain_whitelist(self) -> Dict[str, List[str]]:
         """Build whitelist of official domains for each author."""
         whitelist = {}
 
         for author_id, config in self.authors_config.items():
-            domains = config.get('official_domains', [])
+            # Copy so the shared (cached) authors config is not mutated
+            domains = list(config.get('official_domains', []))
 
             # Add domains from various sources
             for blog in config.get('blogs', []):
@@ -36,6 +49,36 @@ class AuthenticityValidator:
         logger.info(f"Built domain whitelist for {len(whitelist)} authors")
         return whitelist
 
+    def _build_author_rules(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Precompute the per-author lookups used when scoring content.
+
+        Names and domains from the author config are gathered into
+        frozensets once, so scoring an item is a set lookup rather than a
+        scan (and URL parse) over the config lists.
+        """
+        rules = {}
+
+        for author_id, config in self.authors_config.items():
+            domains = self.official_domains.get(author_id, [])
+            blogs = config.get('blogs', [])
+            channels = config.get('youtube_channels', [])
+
+            rules[author_id] = {
+                'domains': frozenset(domains),
+                'domain_suffixes': tuple('.' + domain for domain in domains),
+                'youtube_channels': frozenset(channel.get('name') for channel in channels),
+                'blog_names': frozenset(blog.get('name') for blog in blogs),
+                'blog_domains': frozenset(
+                    urlparse(blog.get('url', '')).netloc.replace('www.', '')
+                    for blog in blogs
+                ),
+                'podcasts': frozenset(podcast.get('name') for podcast in config.get('podcasts', [])),
+                'books': frozenset(book.get('title') for book in config.get('books', [])),
+            }
+
+        return rules
+
     def validate(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate content authenticity and assign a confidence score.
@@ -118,8 +161,8 @@ class AuthenticityValidator:
         if not url:
             return 0
 
-        official_domains = self.official_domains.get(author_id, [])
-        if not official_domains:
+        rules = self.author_rules.get(author_id, _EMPTY_RULES)
+        if not rules['domains']:
             logger.warning(f"No official domains configured for {author_id}")
             return 20  # Neutral score if no domains configured
 
@@ -127,15 +170,14 @@ class AuthenticityValidator:
             domain = urlparse(url).netloc.replace('www.', '')
 
             # Exact match
-            if domain in official_domains:
+            if domain in rules['domains']:
                 logger.debug(f"Domain {domain} verified for {author_id}")
                 return 40
 
             # Check for subdomain match
-            for official_domain in official_domains:
-                if domain.endswith('.' + official_domain) or domain == official_domain:
-                    logger.debug(f"Subdomain {domain} verified for {author_id}")
-                    return 35
+            if domain.endswith(rules['domain_suffixes']):
+                logger.debug(f"Subdomain {domain} verified for {author_id}")
+                return 35
 
             # Domain not in whitelist
             logger.warning(f"Domain {domain} not in whitelist for {author_id}")
@@ -156,21 +198,22 @@ class AuthenticityValidator:
             return 0
 
         author_config = self.authors_config.get(author_id, {})
+        rules = self.author_rules.get(author_id, _EMPTY_RULES)
 
         if platform == 'twitter':
             return self._verify_twitter(author_config, metadata)
 
         elif platform == 'youtube':
-            return self._verify_youtube(author_config, metadata)
+            return self._verify_youtube(rules, metadata)
 
         elif platform == 'blog':
-            return self._verify_blog(author_config, metadata)
+            return self._verify_blog(rules, metadata)
 
         elif platform == 'podcast':
-            return self._verify_podcast(author_config, metadata)
+            return self._verify_podcast(rules, metadata)
 
         elif platform == 'book':
-            return self._verify_book(author_config, metadata)
+            return self._verify_book(rules, metadata)
 
         else:
             logger.warning(f"Unknown platform: {platform}")
@@ -185,65 +228,52 @@ class AuthenticityValidator:
         # Additional verification could check tweet_id validity, etc.
         return 40
 
-    def _verify_youtube(self, author_config: Dict[str, Any], metadata: Dict[str, Any]) -> int:
+    def _verify_youtube(self, rules: Dict[str, Any], metadata: Dict[str, Any]) -> int:
         """Verify YouTube content authenticity."""
         channel_name = metadata.get('channel_name', '')
-        channels = author_config.get('youtube_channels', [])
 
         # Check if channel name matches
-        for channel in channels:
-            if channel.get('name') == channel_name:
-                return 40
+        if channel_name in rules['youtube_channels']:
+            return 40
 
         # If we don't have channel info, give benefit of doubt
-        if not channels:
+        if not rules['youtube_channels']:
             return 30
 
         logger.warning(f"YouTube channel {channel_name} not verified")
         return 15
 
-    def _verify_blog(self, author_config: Dict[str, Any], metadata: Dict[str, Any]) -> int:
+    def _verify_blog(self, rules: Dict[str, Any], metadata: Dict[str, Any]) -> int:
         """Verify blog content authenticity."""
         blog_name = metadata.get('blog_name', '')
         domain = metadata.get('domain', '')
 
-        blogs = author_config.get('blogs', [])
-
         # Check if blog matches configured blogs
-        for blog in blogs:
-            if blog.get('name') == blog_name:
-                return 40
-
-            blog_domain = urlparse(blog.get('url', '')).netloc.replace('www.', '')
-            if blog_domain == domain:
-                return 40
+        if blog_name in rules['blog_names'] or domain in rules['blog_domains']:
+            return 40
 
         logger.warning(f"Blog {blog_name} ({domain}) not verified")
         return 15
 
-    def _verify_podcast(self, author_config: Dict[str, Any], metadata: Dict[str, Any]) -> int:
+    def _verify_podcast(self, rules: Dict[str, Any], metadata: Dict[str, Any]) -> int:
         """Verify podcast content authenticity."""
         podcast_name = metadata.get('podcast_name', '')
-        podcasts = author_config.get('podcasts', [])
 
         # Check if podcast matches configured podcasts
-        for podcast in podcasts:
-            if podcast.get('name') == podcast_name:
-                return 40
+        if podcast_name in rules['podcasts']:
+            return 40
 
         # For guest appearances, score lower
         logger.debug(f"Podcast {podcast_name} may be a guest appearance")
         return 25
 
-    def _verify_book(self, author_config: Dict[str, Any], metadata: Dict[str, Any]) -> int:
+    def _verify_book(self, rules: Dict[str, Any], metadata: Dict[str, Any]) -> int:
         """Verify book content authenticity."""
         book_title = metadata.get('book_title', '')
-        books = author_config.get('books', [])
 
         # Check if book matches configured books
-        for book in books:
-            if book.get('title') == book_title:
-                return 40
+        if book_title in rules['books']:
+            return 40
 
         logger.warning(f"Book {book_title} not verified")
         return 10